@@ -1,11 +1,7 @@
-import sys
-from pathlib import Path
 from datetime import datetime, timedelta
+from itertools import groupby
 from uuid import UUID
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import streamlit as st
 from src.config import settings
 from src.utils.session_state import init_session_state, show_messages, set_success
@@ -13,7 +9,8 @@ from src.database.connection import get_db
 from src.database.repositories.theme_repo import ThemeRepository
 from src.database.repositories.article_repo import ArticleRepository
 from src.database.repositories.question_repo import QuestionRepository
-from src.services.verification_service import ContentService
+from src.services.verification_service import get_content_service
+from src.services.loaders import load_all_themes, load_article
 
 # Page configuration
 st.set_page_config(
@@ -30,7 +27,277 @@ init_session_state()
 show_messages()
 
 # Service
-content_service = ContentService()
+content_service = get_content_service()
+
+
+@st.cache_data(ttl=60)
+def load_articles_for_date(target_date):
+    """Load articles for a single date, cached across reruns."""
+    with get_db() as db:
+        article_repo = ArticleRepository(db)
+        return article_repo.get_articles(
+            start_date=target_date,
+            end_date=target_date,
+            limit=100,
+            # One character more than is shown, so a cut preview is detectable
+            preview_chars=settings.ARTICLE_PREVIEW_CHARS + 1,
+            order_by_theme=True,
+        )
+
+
+@st.cache_data(ttl=300)
+def load_article_questions(learning_item_id):
+    """Load MCQs for one article, only when the reviewer asks for them."""
+    with get_db() as db:
+        question_repo = QuestionRepository(db)
+        return question_repo.get_questions_for_article(learning_item_id)
+
+
+@st.cache_data(ttl=300, max_entries=50)
+def load_similar_themes(visible_themes):
+    """Merge suggestions (pg_trgm similarity) for the (id, name) pairs on screen, in one query."""
+    with get_db() as db:
+        theme_repo = ThemeRepository(db)
+        return theme_repo.find_similar_themes_for_many(
+            [theme_id for theme_id, _ in visible_themes], limit=3
+        )
+
+
+def clear_cached_content():
+    """Invalidate cached articles/themes after an edit."""
+    load_articles_for_date.clear()
+    load_all_themes.clear()
+    load_similar_themes.clear()
+
+
+def get_english_text(content):
+    """Extract English text from content that may have hindi/english keys."""
+    if content is None:
+        return ""
+    if isinstance(content, dict):
+        if "english" in content:
+            return str(content["english"])
+        if "text" in content:
+            return str(content["text"])
+        return str(content)
+    return str(content)
+
+
+# Shown when an article in the cached day list has since been deleted
+ARTICLE_MISSING = "This article no longer exists. Reload the page to refresh the list."
+
+
+@st.fragment
+def render_theme_editor(theme_id, theme_name, similar_list):
+    """Rename / merge controls for one theme, rerun on their own."""
+    with st.expander("Edit Theme", expanded=False):
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            new_theme_name = st.text_input(
+                "Rename Theme",
+                value=theme_name,
+                key=f"theme_name_{theme_id}",
+                label_visibility="collapsed"
+            )
+        with col2:
+            if new_theme_name and new_theme_name != theme_name:
+                if st.button("Save", key=f"save_theme_{theme_id}"):
+                    result = content_service.update_theme_name(UUID(str(theme_id)), new_theme_name)
+                    if result["success"]:
+                        clear_cached_content()
+                        set_success(f"Theme renamed to '{new_theme_name}'")
+                        st.session_state.selected_theme_view = new_theme_name
+                        st.rerun()
+
+        # Merge with similar theme
+        if similar_list:
+            st.caption("Merge into another theme:")
+            for sim in similar_list:
+                if st.button(f"→ Merge into '{sim['name'][:30]}'", key=f"merge_{theme_id}_{sim['id']}"):
+                    result = content_service.merge_themes(UUID(str(theme_id)), sim["id"])
+                    if result["success"]:
+                        clear_cached_content()
+                        set_success(f"Merged {result['articles_moved']} articles!")
+                        st.session_state.selected_theme_view = None
+                        st.rerun()
+
+
+def render_content_preview(preview, article_id, field):
+    """Show a field's preview, or its full text once the reviewer asks for it.
+
+    Previews hold up to ARTICLE_PREVIEW_CHARS + 1 characters; only a longer
+    text than ARTICLE_PREVIEW_CHARS is shown cut.
+    """
+    if len(preview) <= settings.ARTICLE_PREVIEW_CHARS:
+        st.markdown(preview)
+    elif st.toggle("Show full text", key=f"full_{field}_{article_id}"):
+        full_article = load_article(article_id)
+        if full_article is None:
+            st.warning(ARTICLE_MISSING)
+        else:
+            st.markdown(full_article[field])
+    else:
+        st.markdown(f"{preview[:settings.ARTICLE_PREVIEW_CHARS]}…")
+
+
+@st.fragment
+def render_article(article, theme_names_list, theme_ids_list, theme_idx_by_id):
+    """Theme selector, editable analysis tabs and MCQs for one article.
+
+    Runs as a fragment so edit toggles, typing and content saves only rerun
+    this article. Fragment reruns reuse the same ``article`` dict, so saves
+    write the new preview back into it; changing the theme reruns the whole
+    page since the article moves to another group. Full text is only loaded
+    for reading in full or editing.
+    """
+    article_id = article["id"]
+    article_theme_id = article.get("theme_id")
+
+    with st.container(border=True):
+        st.markdown(f"#### 📄 {article['heading']}")
+        show_messages()
+
+        # Theme selector for this article
+        current_theme_idx = theme_idx_by_id.get(article_theme_id, 0)
+
+        col_theme, col_btn = st.columns([3, 1])
+        with col_theme:
+            selected_theme_idx = st.selectbox(
+                "Article Theme",
+                options=range(len(theme_names_list)),
+                format_func=lambda i: theme_names_list[i],
+                index=current_theme_idx,
+                key=f"article_theme_{article_id}",
+                label_visibility="collapsed"
+            )
+        with col_btn:
+            new_article_theme_id = theme_ids_list[selected_theme_idx]
+            if new_article_theme_id != article_theme_id:
+                if st.button("Update", key=f"update_theme_{article_id}"):
+                    result = content_service.update_article(article_id, {"theme_id": new_article_theme_id})
+                    if result["success"]:
+                        load_article.clear(article_id)
+                        load_articles_for_date.clear()
+                        set_success("Article theme updated!")
+                        st.rerun()
+
+        # Tabs for content - show preview by default, edit on button click
+        tabs = st.tabs(["Pointed Analysis", "Mains Analysis", "Prelims Info"])
+
+        # Edit state for all fields of this article, kept in one session entry
+        edit_state = st.session_state.setdefault(
+            f"edit_state_{article_id}",
+            {"pointed": False, "mains": False, "prelims": False},
+        )
+
+        with tabs[0]:
+            render_content_preview(article["pointed_preview"], article_id, "pointed_analysis")
+            if st.button("✏️ Edit", key=f"btn_edit_pointed_{article_id}"):
+                edit_state["pointed"] = not edit_state["pointed"]
+            if edit_state["pointed"]:
+                full_article = load_article(article_id)
+                if full_article is None:
+                    st.warning(ARTICLE_MISSING)
+                else:
+                    pointed = st.text_area(
+                        "Edit Pointed Analysis",
+                        value=full_article["pointed_analysis"],
+                        height=150,
+                        key=f"pointed_{article_id}",
+                        label_visibility="collapsed"
+                    )
+                    if st.button("💾 Save", key=f"save_pointed_{article_id}"):
+                        result = content_service.update_article(article_id, {"pointed_analysis": pointed})
+                        if result["success"]:
+                            edit_state["pointed"] = False
+                            article["pointed_preview"] = pointed[:settings.ARTICLE_PREVIEW_CHARS + 1]
+                            load_article.clear(article_id)
+                            load_articles_for_date.clear()
+                            set_success("Pointed Analysis saved!")
+                            st.rerun(scope="fragment")
+
+        with tabs[1]:
+            render_content_preview(article["mains_preview"], article_id, "mains_analysis")
+            if st.button("✏️ Edit", key=f"btn_edit_mains_{article_id}"):
+                edit_state["mains"] = not edit_state["mains"]
+            if edit_state["mains"]:
+                full_article = load_article(article_id)
+                if full_article is None:
+                    st.warning(ARTICLE_MISSING)
+                else:
+                    mains = st.text_area(
+                        "Edit Mains Analysis",
+                        value=full_article["mains_analysis"],
+                        height=150,
+                        key=f"mains_{article_id}",
+                        label_visibility="collapsed"
+                    )
+                    if st.button("💾 Save", key=f"save_mains_{article_id}"):
+                        result = content_service.update_article(article_id, {"mains_analysis": mains})
+                        if result["success"]:
+                            edit_state["mains"] = False
+                            article["mains_preview"] = mains[:settings.ARTICLE_PREVIEW_CHARS + 1]
+                            load_article.clear(article_id)
+                            load_articles_for_date.clear()
+                            set_success("Mains Analysis saved!")
+                            st.rerun(scope="fragment")
+
+        with tabs[2]:
+            render_content_preview(article["prelims_preview"], article_id, "prelims_info")
+            if st.button("✏️ Edit", key=f"btn_edit_prelims_{article_id}"):
+                edit_state["prelims"] = not edit_state["prelims"]
+            if edit_state["prelims"]:
+                full_article = load_article(article_id)
+                if full_article is None:
+                    st.warning(ARTICLE_MISSING)
+                else:
+                    prelims = st.text_area(
+                        "Edit Prelims Info",
+                        value=full_article["prelims_info"],
+                        height=150,
+                        key=f"prelims_{article_id}",
+                        label_visibility="collapsed"
+                    )
+                    if st.button("💾 Save", key=f"save_prelims_{article_id}"):
+                        result = content_service.update_article(article_id, {"prelims_info": prelims})
+                        if result["success"]:
+                            edit_state["prelims"] = False
+                            article["prelims_preview"] = prelims[:settings.ARTICLE_PREVIEW_CHARS + 1]
+                            load_article.clear(article_id)
+                            load_articles_for_date.clear()
+                            set_success("Prelims Info saved!")
+                            st.rerun(scope="fragment")
+
+        # MCQs section - fetched only once the reviewer opens it
+        if st.toggle("📝 Show MCQs", key=f"show_mcqs_{article_id}"):
+            article_questions = load_article_questions(article["learning_item_id"])
+            if not article_questions:
+                st.caption("No MCQs linked to this article")
+            else:
+                st.markdown(f"**MCQs ({len(article_questions)})**")
+                for i, q in enumerate(article_questions):
+                    st.markdown(f"**Q{i+1}.** {q.get('question_text', '')}")
+
+                    # Options
+                    options = q.get("options")
+                    if options and isinstance(options, list):
+                        for opt in options:
+                            if isinstance(opt, dict):
+                                opt_id = opt.get('id', '')
+                                opt_text = opt.get('text', opt.get('value', str(opt)))
+                                is_correct = str(opt_id) in [str(c) for c in (q.get("correct_option_ids") or [])]
+                                marker = " ✓" if is_correct else ""
+                                st.markdown(f"- {opt_text}{marker}")
+
+                    # Explanation
+                    explanation = q.get("explanation")
+                    if explanation:
+                        with st.expander("Explanation", expanded=False):
+                            st.markdown(get_english_text(explanation))
+
+                    if i < len(article_questions) - 1:
+                        st.markdown("---")
+
 
 # Date filter selection
 today = datetime.now().date()
@@ -91,20 +358,11 @@ st.markdown(f"**{selected_date.strftime('%A, %d %B %Y')}**")
 st.markdown("---")
 
 try:
-    with get_db() as db:
-        theme_repo = ThemeRepository(db)
-        article_repo = ArticleRepository(db)
+    # Get articles for selected date
+    todays_articles = load_articles_for_date(selected_date)
 
-        # Get articles for selected date
-        todays_articles = article_repo.get_articles(
-            start_date=selected_date,
-            end_date=selected_date,
-            limit=100,
-        )
-
-        # Get all themes for the dropdown
-        all_themes = theme_repo.get_all_themes(limit=500)
-        all_themes_list = [{"id": t["id"], "name": t["name"]} for t in all_themes]
+    # Get all themes for the dropdown
+    all_themes_list = load_all_themes()
 
     if not todays_articles:
         st.info(f"No articles found for {selected_date.strftime('%d %b %Y')}.")
@@ -121,19 +379,18 @@ try:
             if st.button("📖 Definitions", use_container_width=True):
                 st.switch_page("pages/4_definitions.py")
     else:
-        # Group articles by theme
+        # Group articles by theme (rows arrive sorted by theme name)
         themes_dict = {}
-        theme_order = []  # Keep track of order
-        for article in todays_articles:
-            theme_id = article.get("theme_id")
-            theme_name = article.get("theme_name") or "Uncategorized"
-            if theme_name not in themes_dict:
-                themes_dict[theme_name] = {
-                    "theme_id": theme_id,
-                    "articles": []
-                }
-                theme_order.append(theme_name)
-            themes_dict[theme_name]["articles"].append(article)
+        for theme_name, group in groupby(
+            todays_articles, key=lambda a: a.get("theme_name") or "Uncategorized"
+        ):
+            articles = list(group)
+            # Groups that share a display name (e.g. no theme and an empty
+            # theme name, both "Uncategorized") need not be adjacent
+            themes_dict.setdefault(
+                theme_name, {"theme_id": articles[0].get("theme_id"), "articles": []}
+            )["articles"].extend(articles)
+        theme_order = list(themes_dict)
 
         st.markdown(f"### {len(todays_articles)} articles in {len(themes_dict)} themes")
 
@@ -163,206 +420,38 @@ try:
         else:
             themes_to_show = themes_dict
 
+        # Theme selector options, shared by every article
+        theme_names_list = ["None"] + [t["name"] for t in all_themes_list]
+        theme_ids_list = [None] + [t["id"] for t in all_themes_list]
+        theme_idx_by_id = {tid: i for i, tid in enumerate(theme_ids_list)}
+
+        # Merge suggestions for every theme shown, fetched together
+        similar_by_theme = load_similar_themes(
+            tuple(
+                (theme_data["theme_id"], theme_name)
+                for theme_name, theme_data in themes_to_show.items()
+                if theme_data["theme_id"] is not None
+            )
+        )
+
         # Display each theme with its articles
         for theme_name, theme_data in themes_to_show.items():
             theme_id = theme_data["theme_id"]
             articles = theme_data["articles"]
 
             st.markdown(f"## 🏷️ {theme_name}")
-            st.caption(f"{len(articles)} articles")
-
-            # Theme editing section - only show if theme exists (not Uncategorized)
-            if theme_id:
-                with st.expander("Edit Theme", expanded=False):
-                    col1, col2 = st.columns([3, 1])
-                    with col1:
-                        new_theme_name = st.text_input(
-                            "Rename Theme",
-                            value=theme_name,
-                            key=f"theme_name_{theme_id}",
-                            label_visibility="collapsed"
-                        )
-                    with col2:
-                        if new_theme_name and new_theme_name != theme_name:
-                            if st.button("Save", key=f"save_theme_{theme_id}"):
-                                result = content_service.update_theme_name(UUID(str(theme_id)), new_theme_name)
-                                if result["success"]:
-                                    set_success(f"Theme renamed to '{new_theme_name}'")
-                                    st.session_state.selected_theme_view = new_theme_name
-                                    st.rerun()
-
-                    # Merge with similar theme
-                    with get_db() as db:
-                        theme_repo = ThemeRepository(db)
-                        similar = theme_repo.find_similar_themes(theme_name, exclude_id=theme_id, limit=3)
-                        similar_list = [{"id": s.id, "name": s.name} for s in similar]
-
-                    if similar_list:
-                        st.caption("Merge into another theme:")
-                        for sim in similar_list:
-                            if st.button(f"→ Merge into '{sim['name'][:30]}'", key=f"merge_{theme_id}_{sim['id']}"):
-                                result = content_service.merge_themes(UUID(str(theme_id)), sim["id"])
-                                if result["success"]:
-                                    set_success(f"Merged {result['articles_moved']} articles!")
-                                    st.session_state.selected_theme_view = None
-                                    st.rerun()
+
+            # Theme editing section - the Uncategorized bucket has nothing to
+            # rename or merge, so skip the editor and its similarity lookup
+            if theme_id is None:
+                st.caption(f"{len(articles)} articles · no theme assigned")
+            else:
+                st.caption(f"{len(articles)} articles")
+                render_theme_editor(theme_id, theme_name, similar_by_theme[theme_id])
 
             # Display articles
             for article in articles:
-                article_id = article["id"]
-                article_theme_id = article.get("theme_id")
-
-                with st.container(border=True):
-                    st.markdown(f"#### 📄 {article['heading']}")
-
-                    # Load full article data for editing
-                    with get_db() as db:
-                        article_repo = ArticleRepository(db)
-                        question_repo = QuestionRepository(db)
-                        full_article = article_repo.get_article_by_id(article_id)
-                        if full_article:
-                            article_mains = full_article.mains_info or ""
-                            article_prelims = full_article.prelims_info or ""
-                            article_pointed = full_article.text or ""
-                            # Get MCQs linked via item_relations
-                            article_questions = question_repo.get_questions_for_article(full_article.learning_item_id)
-                        else:
-                            article_questions = []
-
-                    # Theme selector for this article
-                    theme_names_list = ["None"] + [t["name"] for t in all_themes_list]
-                    theme_ids_list = [None] + [t["id"] for t in all_themes_list]
-                    current_theme_idx = 0
-                    if article_theme_id:
-                        for i, tid in enumerate(theme_ids_list):
-                            if tid == article_theme_id:
-                                current_theme_idx = i
-                                break
-
-                    col_theme, col_btn = st.columns([3, 1])
-                    with col_theme:
-                        selected_theme_idx = st.selectbox(
-                            "Article Theme",
-                            options=range(len(theme_names_list)),
-                            format_func=lambda i: theme_names_list[i],
-                            index=current_theme_idx,
-                            key=f"article_theme_{article_id}",
-                            label_visibility="collapsed"
-                        )
-                    with col_btn:
-                        new_article_theme_id = theme_ids_list[selected_theme_idx]
-                        if new_article_theme_id != article_theme_id:
-                            if st.button("Update", key=f"update_theme_{article_id}"):
-                                result = content_service.update_article(article_id, {"theme_id": new_article_theme_id})
-                                if result["success"]:
-                                    set_success("Article theme updated!")
-                                    st.rerun()
-
-                    # Tabs for content - show preview by default, edit on button click
-                    tabs = st.tabs(["Pointed Analysis", "Mains Analysis", "Prelims Info"])
-
-                    # Track edit state for each field
-                    edit_pointed_key = f"edit_pointed_{article_id}"
-                    edit_mains_key = f"edit_mains_{article_id}"
-                    edit_prelims_key = f"edit_prelims_{article_id}"
-
-                    with tabs[0]:
-                        st.markdown(article_pointed)
-                        if st.button("✏️ Edit", key=f"btn_edit_pointed_{article_id}"):
-                            st.session_state[edit_pointed_key] = not st.session_state.get(edit_pointed_key, False)
-                            st.rerun()
-                        if st.session_state.get(edit_pointed_key, False):
-                            pointed = st.text_area(
-                                "Edit Pointed Analysis",
-                                value=article_pointed,
-                                height=150,
-                                key=f"pointed_{article_id}",
-                                label_visibility="collapsed"
-                            )
-                            if st.button("💾 Save", key=f"save_pointed_{article_id}"):
-                                result = content_service.update_article(article_id, {"pointed_analysis": pointed})
-                                if result["success"]:
-                                    st.session_state[edit_pointed_key] = False
-                                    set_success("Pointed Analysis saved!")
-                                    st.rerun()
-
-                    with tabs[1]:
-                        st.markdown(article_mains)
-                        if st.button("✏️ Edit", key=f"btn_edit_mains_{article_id}"):
-                            st.session_state[edit_mains_key] = not st.session_state.get(edit_mains_key, False)
-                            st.rerun()
-                        if st.session_state.get(edit_mains_key, False):
-                            mains = st.text_area(
-                                "Edit Mains Analysis",
-                                value=article_mains,
-                                height=150,
-                                key=f"mains_{article_id}",
-                                label_visibility="collapsed"
-                            )
-                            if st.button("💾 Save", key=f"save_mains_{article_id}"):
-                                result = content_service.update_article(article_id, {"mains_analysis": mains})
-                                if result["success"]:
-                                    st.session_state[edit_mains_key] = False
-                                    set_success("Mains Analysis saved!")
-                                    st.rerun()
-
-                    with tabs[2]:
-                        st.markdown(article_prelims)
-                        if st.button("✏️ Edit", key=f"btn_edit_prelims_{article_id}"):
-                            st.session_state[edit_prelims_key] = not st.session_state.get(edit_prelims_key, False)
-                            st.rerun()
-                        if st.session_state.get(edit_prelims_key, False):
-                            prelims = st.text_area(
-                                "Edit Prelims Info",
-                                value=article_prelims,
-                                height=150,
-                                key=f"prelims_{article_id}",
-                                label_visibility="collapsed"
-                            )
-                            if st.button("💾 Save", key=f"save_prelims_{article_id}"):
-                                result = content_service.update_article(article_id, {"prelims_info": prelims})
-                                if result["success"]:
-                                    st.session_state[edit_prelims_key] = False
-                                    set_success("Prelims Info saved!")
-                                    st.rerun()
-
-                    # Helper function to extract English text
-                    def get_english_text(content):
-                        if content is None:
-                            return ""
-                        if isinstance(content, dict):
-                            if "english" in content:
-                                return str(content["english"])
-                            if "text" in content:
-                                return str(content["text"])
-                            return str(content)
-                        return str(content)
-
-                    # MCQs section - collapsible
-                    if article_questions:
-                        with st.expander(f"📝 MCQs ({len(article_questions)})", expanded=False):
-                            for i, q in enumerate(article_questions):
-                                st.markdown(f"**Q{i+1}.** {q.get('question_text', '')}")
-
-                                # Options
-                                options = q.get("options")
-                                if options and isinstance(options, list):
-                                    for opt in options:
-                                        if isinstance(opt, dict):
-                                            opt_id = opt.get('id', '')
-                                            opt_text = opt.get('text', opt.get('value', str(opt)))
-                                            is_correct = str(opt_id) in [str(c) for c in (q.get("correct_option_ids") or [])]
-                                            marker = " ✓" if is_correct else ""
-                                            st.markdown(f"- {opt_text}{marker}")
-
-                                # Explanation
-                                explanation = q.get("explanation")
-                                if explanation:
-                                    with st.expander("Explanation", expanded=False):
-                                        st.markdown(get_english_text(explanation))
-
-                                if i < len(article_questions) - 1:
-                                    st.markdown("---")
+                render_article(article, theme_names_list, theme_ids_list, theme_idx_by_id)
 
             st.markdown("---")
 
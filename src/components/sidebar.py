@@ -1,24 +1,52 @@
 import streamlit as st
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+
+def date_label(day: date) -> str:
+    """Display label for a date, e.g. "05 Mar 2025"."""
+    return day.strftime("%d %b %Y")
+
+
+@lru_cache(maxsize=64)
+def resolve_date_filter(date_filter: str, custom_date: date, today: date):
+    """(start_date, end_date, caption) for a quick date filter of the themes pages.
+
+    date_filter is one of "custom", "today", "yesterday", "week", "month" or
+    "all"; anything else also means all dates, (None, None).
+    """
+    if date_filter == "custom":
+        return custom_date, custom_date, f"Showing themes with articles from {custom_date.strftime('%d %b %Y')}"
+    if date_filter == "today":
+        return today, today, f"Showing themes with articles from today ({today.strftime('%d %b')})"
+    if date_filter == "yesterday":
+        yesterday = today - timedelta(days=1)
+        return yesterday, yesterday, f"Showing themes with articles from yesterday ({yesterday.strftime('%d %b')})"
+    if date_filter == "week":
+        return today - timedelta(days=7), today, "Showing themes with articles from last 7 days"
+    if date_filter == "month":
+        return today - timedelta(days=30), today, "Showing themes with articles from last 30 days"
+    return None, None, "Showing all themes"
 
 
 def render_sidebar_filters():
     """Render common sidebar filters."""
     st.sidebar.header("Filters")
 
+    today = datetime.now().date()
+    default_start = today - timedelta(days=30)
+
     # Quick filter buttons
     col1, col2 = st.sidebar.columns(2)
     with col1:
         if st.button("Today", use_container_width=True):
             st.session_state.show_all_dates = False
             st.session_state.today_filter = True
-            st.session_state.current_page = 1
             st.rerun()
     with col2:
         if st.button("Show All", use_container_width=True):
             st.session_state.show_all_dates = True
             st.session_state.today_filter = False
-            st.session_state.current_page = 1
             st.rerun()
 
     # Check filter states
@@ -30,16 +58,14 @@ def render_sidebar_filters():
     with col1:
         start_date = st.date_input(
             "From",
-            value=st.session_state.get(
-                "date_filter_start", datetime.now().date() - timedelta(days=30)
-            ),
+            value=st.session_state.get("date_filter_start", default_start),
             key="sidebar_start_date",
             disabled=show_all or today_filter,
         )
     with col2:
         end_date = st.date_input(
             "To",
-            value=st.session_state.get("date_filter_end", datetime.now().date()),
+            value=st.session_state.get("date_filter_end", today),
             key="sidebar_end_date",
             disabled=show_all or today_filter,
         )
@@ -48,14 +74,13 @@ def render_sidebar_filters():
     if show_all:
         st.sidebar.caption("Showing all dates")
     elif today_filter:
-        st.sidebar.caption(f"Showing today: {datetime.now().date().strftime('%d %b %Y')}")
+        st.sidebar.caption(f"Showing today: {date_label(today)}")
 
     # Reset button
     if show_all or today_filter:
         if st.sidebar.button("Reset Filters", use_container_width=True):
             st.session_state.show_all_dates = False
             st.session_state.today_filter = False
-            st.session_state.current_page = 1
             st.rerun()
 
     # Update session state
@@ -76,7 +101,6 @@ def render_sidebar_filters():
         return_start = None
         return_end = None
     elif today_filter:
-        today = datetime.now().date()
         return_start = today
         return_end = today
     else:
@@ -90,28 +114,59 @@ def render_sidebar_filters():
     }
 
 
-def render_pagination(total_items: int, page_size: int = 20):
-    """Render pagination controls."""
-    total_pages = max(1, (total_items + page_size - 1) // page_size)
-    current_page = st.session_state.get("current_page", 1)
+def get_page_cursor(state_key: str, filter_key):
+    """Get the keyset cursor for the current page.
+
+    The cursor stack in session state is reset whenever filter_key changes.
+    """
+    if st.session_state.get(f"{state_key}_filters") != filter_key:
+        st.session_state[f"{state_key}_filters"] = filter_key
+        st.session_state[state_key] = []
+
+    cursors = st.session_state[state_key]
+    return cursors[-1] if cursors else None
+
+
+def render_cursor_pagination(
+    state_key: str,
+    next_cursor,
+    total_items: int,
+    page_size: int = 20,
+    approximate: bool = False,
+):
+    """Render pagination controls for keyset pagination.
+
+    Next pushes the last row's cursor onto the stack, Previous pops it; both
+    run as on_click callbacks, so inside a fragment only the fragment reruns.
+    With approximate, total_items is an estimate and the page total shows "≈".
+    The controls follow the cursors, not the total, so a stale estimate
+    never hides a page that exists.
+    """
+    cursors = st.session_state.get(state_key, [])
+    current_page = len(cursors) + 1
+    total_pages = max(
+        current_page + (next_cursor is not None),
+        (total_items + page_size - 1) // page_size,
+    )
 
-    if total_pages > 1:
+    if cursors or next_cursor is not None:
         col1, col2, col3 = st.columns([1, 2, 1])
 
         with col1:
-            if st.button("← Previous", disabled=current_page <= 1):
-                st.session_state.current_page = current_page - 1
-                st.rerun()
+            st.button("← Previous", disabled=not cursors, on_click=cursors.pop)
 
         with col2:
             st.markdown(
-                f"<div style='text-align: center'>Page {current_page} of {total_pages}</div>",
+                f"<div style='text-align: center'>Page {current_page} of {'≈' if approximate else ''}{total_pages}</div>",
                 unsafe_allow_html=True,
             )
 
         with col3:
-            if st.button("Next →", disabled=current_page >= total_pages):
-                st.session_state.current_page = current_page + 1
-                st.rerun()
+            st.button(
+                "Next →",
+                disabled=next_cursor is None,
+                on_click=cursors.append,
+                args=(next_cursor,),
+            )
 
-    return current_page, page_size
+    return current_page
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 import streamlit as st
 
 
@@ -6,10 +8,16 @@ class Settings:
     APP_NAME: str = "UPSC Expert Verification Tool"
     DEBUG: bool = False
 
+    # With DEBUG, warn when one get_db() block runs more queries than this
+    QUERY_WARN_THRESHOLD: int = 10
+
     # Pagination
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
 
+    # Characters of analysis text shown before "Show full text"
+    ARTICLE_PREVIEW_CHARS: int = 400
+
     @property
     def DB_HOST(self) -> str:
         return st.secrets["DB_HOST"]
@@ -30,9 +38,9 @@ class Settings:
     def DB_PASSWORD(self) -> str:
         return st.secrets["DB_PASSWORD"]
 
-    @property
+    @cached_property
     def DATABASE_URL(self) -> str:
-        """Build database URL from separate credentials."""
+        """Build database URL from separate credentials, once per process."""
         return f"postgresql://{self.DB_USERNAME}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
 
@@ -1,39 +1,94 @@
-from contextlib import contextmanager
-from typing import Generator
+import logging
+from contextlib import contextmanager, nullcontext
+from typing import Generator, List, Optional, Union
 
-from sqlalchemy import create_engine
+import streamlit as st
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
 from src.config import settings
 
-# Create engine with connection pooling
-engine = create_engine(
-    settings.DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=5,
-    max_overflow=10,
-    pool_pre_ping=True,
-    echo=settings.DEBUG,
-)
+logger = logging.getLogger(__name__)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@st.cache_resource
+def get_engine() -> Engine:
+    """Create the pooled engine once per process (shared across reruns and sessions)."""
+    return create_engine(
+        settings.DATABASE_URL,
+        poolclass=QueuePool,
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=10,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        connect_args={"connect_timeout": 10},
+        echo=settings.DEBUG,
+    )
+
+
+@st.cache_resource
+def get_session_factory() -> sessionmaker:
+    """Session factory bound to the shared engine."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
 
 
 @contextmanager
-def get_db() -> Generator[Session, None, None]:
-    """Context manager for database sessions."""
-    db = SessionLocal()
+def count_queries(
+    bind: Optional[Union[Engine, Connection]] = None,
+) -> Generator[List[str], None, None]:
+    """Collect the SQL statements executed inside the block.
+
+    Catches N+1 regressions, e.g. ``with count_queries() as queries: ...``
+    then ``assert len(queries) <= 2``. With an engine (the shared one by
+    default) the listener is engine-wide, so statements from other sessions
+    running at the same time are counted too; pass a session's connection,
+    ``db.connection()``, to count only that session's statements.
+    """
+    bind = bind or get_engine()
+    queries: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(bind, "before_cursor_execute", record)
     try:
-        yield db
-        db.commit()
-    except Exception:
-        db.rollback()
-        raise
+        yield queries
     finally:
-        db.close()
+        event.remove(bind, "before_cursor_execute", record)
+
+
+@contextmanager
+def get_db() -> Generator[Session, None, None]:
+    """Context manager for database sessions.
+
+    With settings.DEBUG, logs a warning when the block runs more than
+    settings.QUERY_WARN_THRESHOLD queries. Only this session's connection is
+    watched, so concurrent Streamlit sessions on the shared pool are not
+    counted.
+    """
+    db = get_session_factory()()
+    with count_queries(db.connection()) if settings.DEBUG else nullcontext() as queries:
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    if queries is not None and len(queries) > settings.QUERY_WARN_THRESHOLD:
+        logger.warning(
+            "%d queries in one session (threshold %d):\n%s",
+            len(queries),
+            settings.QUERY_WARN_THRESHOLD,
+            "\n".join(queries),
+        )
 
 
 def get_db_session() -> Session:
     """Get a database session for Streamlit (non-context manager version)."""
-    return SessionLocal()
+    return get_session_factory()()
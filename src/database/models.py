@@ -15,7 +15,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB, ARRAY
 from sqlalchemy.orm import declarative_base, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text as sql_text
 
 Base = declarative_base()
 
@@ -63,6 +63,10 @@ class NewsArticle(Base):
 
     # Relationships
     theme = relationship("NewsTheme", back_populates="articles")
+    # Read-only: links are added and removed through ArticleKeyword
+    keywords = relationship(
+        "Glossary", secondary="article_keywords", back_populates="articles", viewonly=True
+    )
 
     def __repr__(self):
         return f"<NewsArticle(id={self.id}, title='{self.title[:50] if self.title else ''}')>"
@@ -79,6 +83,9 @@ class Glossary(Base):
 
     # Relationships
     article_links = relationship("ArticleKeyword", back_populates="keyword_obj")
+    articles = relationship(
+        "NewsArticle", secondary="article_keywords", back_populates="keywords", viewonly=True
+    )
 
     def __repr__(self):
         return f"<Glossary(id={self.id}, keyword='{self.keyword}')>"
@@ -89,6 +96,7 @@ class ArticleKeyword(Base):
 
     article_id = Column(
         PGUUID(as_uuid=True),
+        ForeignKey("news_articles.id", ondelete="CASCADE"),
         primary_key=True,
     )
     keyword_id = Column(
@@ -199,3 +207,85 @@ class ArticleGeneratedQuestion(Base):
 
     def __repr__(self):
         return f"<ArticleGeneratedQuestion(id={self.question_id}, type='{self.type}')>"
+
+
+# ============================================
+# INDEXES
+# ============================================
+# The tables are owned by the content pipeline, so these are not created by
+# this app; they document the indexes the dashboard queries rely on.
+
+# Daily article lists: WHERE date BETWEEN .. joined to the theme
+Index(
+    "ix_news_articles_date_theme",
+    NewsArticle.date.desc(),
+    NewsArticle.news_theme_id,
+    postgresql_include=["title"],
+)
+
+# Per-theme article lists: WHERE newsThemeId = .. ORDER BY date DESC, id DESC,
+# with (date, id) < cursor for keyset pagination
+Index(
+    "ix_news_articles_theme_date",
+    NewsArticle.news_theme_id,
+    NewsArticle.date.desc(),
+    NewsArticle.id.desc(),
+    postgresql_include=["title"],
+)
+
+# Article title search: title_search_filter() matches this expression
+Index(
+    "ix_news_articles_title_fts",
+    func.to_tsvector(sql_text("'simple'"), NewsArticle.title),
+    postgresql_using="gin",
+)
+
+# ILIKE '%term%' fallback in title_search_filter() (requires pg_trgm)
+Index(
+    "ix_news_articles_title_trgm",
+    NewsArticle.title,
+    postgresql_using="gin",
+    postgresql_ops={"title": "gin_trgm_ops"},
+)
+
+# Glossary keyword search: ILIKE '%term%' on keyword (requires pg_trgm)
+Index(
+    "ix_glossary_keyword_trgm",
+    Glossary.keyword,
+    postgresql_using="gin",
+    postgresql_ops={"keyword": "gin_trgm_ops"},
+)
+
+# Keyword -> articles lookups; article -> keywords is served by the
+# (article_id, keyword_id) primary key
+Index("ix_article_keywords_keyword", ArticleKeyword.keyword_id)
+
+# Article -> MCQs: item_relations WHERE sourceItemId = .. yields targetItemId
+Index(
+    "ix_item_relations_source_target",
+    ItemRelation.source_item_id,
+    ItemRelation.target_item_id,
+)
+
+# ... then mcqs WHERE learningItemId = .. ORDER BY question_pattern, createdAt
+Index(
+    "ix_mcqs_learning_item_pattern_created",
+    MCQ.learning_item_id,
+    MCQ.question_pattern,
+    MCQ.created_at,
+)
+
+# Theme name search: theme_name_search() matches this expression
+Index(
+    "ix_news_themes_name_fts",
+    func.to_tsvector(sql_text("'simple'"), NewsTheme.name),
+    postgresql_using="gin",
+)
+
+# Similar-theme lookups on theme names (requires the pg_trgm extension)
+Index(
+    "ix_news_themes_name_trgm",
+    NewsTheme.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+)
@@ -1,151 +1,260 @@
-from typing import List, Optional, Dict, Any
+import re
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import date, datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import func, cast, Date as SQLDate
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import Select, func, select, text, tuple_
 
-from src.database.models import NewsArticle, NewsTheme, ArticleKeyword, Glossary
+from src.database.models import NewsArticle, NewsTheme
+
+
+# Map old field names to new column names for update_article
+ARTICLE_FIELD_MAPPING = {
+    "heading": "title",
+    "pointed_analysis": "text",
+    "mains_analysis": "mains_info",
+    "prelims_info": "prelims_info",
+    "description": "description",
+    "theme_id": "news_theme_id",
+    # Direct new field names also accepted
+    "title": "title",
+    "text": "text",
+    "mains_info": "mains_info",
+    "news_theme_id": "news_theme_id",
+}
+
+# Mapped column attributes update_article may set
+ARTICLE_COLUMNS = frozenset(NewsArticle.__mapper__.column_attrs.keys())
+
+
+def title_search_filter(search: str):
+    """Full-text match on article titles, prefix-matching each search word.
+
+    Uses the to_tsvector('simple', title) expression so the GIN index on it
+    applies. Falls back to ILIKE when the search has no word characters.
+    """
+    words = re.findall(r"[^\W_]+", search)
+    if not words:
+        return NewsArticle.title.ilike(f"%{search}%")
+    tsquery = " & ".join(f"{word}:*" for word in words)
+    return func.to_tsvector("simple", NewsArticle.title).op("@@")(
+        func.to_tsquery("simple", tsquery)
+    )
 
 
 class ArticleRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_articles(
+    def _articles_query(
         self,
         theme_id: Optional[UUID] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         search: Optional[str] = None,
-        limit: int = 50,
-        offset: int = 0,
-    ) -> List[dict]:
-        """Get articles with optional filters."""
-        query = self.db.query(
-            NewsArticle,
+        preview_chars: Optional[int] = None,
+        order_by_theme: bool = False,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> Select:
+        """Build the filtered, ordered article list statement (see get_articles).
+
+        Columns are labelled with the keys of the returned article dicts.
+        """
+        columns = [
+            NewsArticle.id,
+            NewsArticle.title.label("heading"),
+            NewsArticle.description,
+            NewsArticle.date,
+            NewsArticle.news_theme_id.label("theme_id"),
             NewsTheme.name.label("theme_name"),
-        ).outerjoin(NewsTheme, NewsArticle.news_theme_id == NewsTheme.id)
+            NewsArticle.source,
+        ]
+        if preview_chars:
+            columns += [
+                func.coalesce(func.left(NewsArticle.text, preview_chars), "").label("pointed_preview"),
+                func.coalesce(func.left(NewsArticle.mains_info, preview_chars), "").label("mains_preview"),
+                func.coalesce(func.left(NewsArticle.prelims_info, preview_chars), "").label("prelims_preview"),
+                NewsArticle.learning_item_id,
+            ]
+
+        stmt = (
+            select(*columns)
+            .select_from(NewsArticle)
+            .outerjoin(NewsTheme, NewsArticle.news_theme_id == NewsTheme.id)
+        )
 
         if theme_id:
-            query = query.filter(NewsArticle.news_theme_id == theme_id)
+            stmt = stmt.where(NewsArticle.news_theme_id == theme_id)
 
-        if start_date:
-            query = query.filter(NewsArticle.date >= start_date)
-        if end_date:
-            query = query.filter(NewsArticle.date <= end_date)
+        if start_date and start_date == end_date:
+            # Single-day view: one bound parameter, equality lookup on the date index
+            stmt = stmt.where(NewsArticle.date == start_date)
+        else:
+            if start_date:
+                stmt = stmt.where(NewsArticle.date >= start_date)
+            if end_date:
+                stmt = stmt.where(NewsArticle.date <= end_date)
 
         if search:
-            query = query.filter(NewsArticle.title.ilike(f"%{search}%"))
+            stmt = stmt.where(title_search_filter(search))
 
-        results = (
-            query.order_by(NewsArticle.date.desc()).offset(offset).limit(limit).all()
-        )
+        if after:
+            stmt = stmt.where(
+                tuple_(NewsArticle.date, NewsArticle.id) < tuple_(*after)
+            )
 
-        return [
-            {
-                "id": r.NewsArticle.id,
-                "heading": r.NewsArticle.title,
-                "description": r.NewsArticle.description,
-                "date": r.NewsArticle.date,
-                "theme_id": r.NewsArticle.news_theme_id,
-                "theme_name": r.theme_name,
-                "source": r.NewsArticle.source,
-            }
-            for r in results
-        ]
+        if order_by_theme:
+            stmt = stmt.order_by(
+                func.coalesce(NewsTheme.name, "Uncategorized"), NewsArticle.title
+            )
+        else:
+            stmt = stmt.order_by(NewsArticle.date.desc(), NewsArticle.id.desc())
 
-    def get_article_by_id(self, article_id: UUID) -> Optional[NewsArticle]:
-        """Get a single article by UUID."""
-        return (
-            self.db.query(NewsArticle).filter(NewsArticle.id == article_id).first()
-        )
+        return stmt
 
-    def get_article_with_keywords(self, article_uuid: UUID) -> Optional[dict]:
-        """Get article with its associated keywords."""
-        article = (
-            self.db.query(NewsArticle)
-            .filter(NewsArticle.id == article_uuid)
-            .first()
-        )
+    def get_articles(
+        self,
+        theme_id: Optional[UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        preview_chars: Optional[int] = None,
+        order_by_theme: bool = False,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> List[dict]:
+        """Get articles with optional filters.
 
-        if not article:
-            return None
+        Rows are ordered newest first with id as a tie-breaker. To page, pass
+        the (date, id) of the last row seen as ``after`` (keyset pagination).
 
-        keywords = (
-            self.db.query(Glossary)
-            .join(ArticleKeyword, ArticleKeyword.keyword_id == Glossary.id)
-            .filter(ArticleKeyword.article_id == article_uuid)
-            .all()
+        Only the listed columns are selected, never the full analysis text.
+        With preview_chars, each row carries the first preview_chars
+        characters of the pointed, mains and prelims text plus
+        learning_item_id, enough to render a list without re-fetching every
+        article.
+        With order_by_theme, rows come back sorted by theme name (unthemed
+        articles as "Uncategorized") and title, ready for grouping.
+        """
+        stmt = self._articles_query(
+            theme_id=theme_id,
+            start_date=start_date,
+            end_date=end_date,
+            search=search,
+            preview_chars=preview_chars,
+            order_by_theme=order_by_theme,
+            after=after,
         )
+        rows = self.db.execute(stmt.limit(limit)).mappings()
+        return [dict(row) for row in rows]
+
+    def get_articles_with_count(
+        self,
+        theme_id: Optional[UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> Tuple[List[dict], int]:
+        """Get a page of articles plus the number of matching rows, in one query.
+
+        The count comes from COUNT(*) OVER () and so covers every row that
+        matches the filters, including ``after``, before LIMIT applies.
+        """
+        stmt = self._articles_query(
+            theme_id=theme_id,
+            start_date=start_date,
+            end_date=end_date,
+            search=search,
+            after=after,
+        ).add_columns(func.count().over().label("total_count"))
 
-        return {"article": article, "keywords": keywords}
+        rows = self.db.execute(stmt.limit(limit)).mappings()
+        articles = [dict(row) for row in rows]
+        total = articles[0]["total_count"] if articles else 0
+        for article in articles:
+            del article["total_count"]
+        return articles, total
+
+    def get_article_by_id(self, article_id: UUID) -> Optional[NewsArticle]:
+        """Get a single article by UUID."""
+        return self.db.get(NewsArticle, article_id)
 
-    def update_article(
-        self, article_id: UUID, updates: Dict[str, Any]
-    ) -> Optional[NewsArticle]:
-        """Update article fields."""
-        article = (
-            self.db.query(NewsArticle).filter(NewsArticle.id == article_id).first()
+    def get_article_with_keywords(self, article_uuid: UUID) -> Optional[dict]:
+        """Get article with its associated keywords.
+
+        The keywords come from one IN query via selectinload, so the article
+        row is fetched once rather than repeated for every keyword.
+        """
+        stmt = (
+            select(NewsArticle)
+            .options(selectinload(NewsArticle.keywords))
+            .where(NewsArticle.id == article_uuid)
         )
-        if not article:
+        article = self.db.execute(stmt).scalar_one_or_none()
+        if article is None:
             return None
+        return {"article": article, "keywords": article.keywords}
 
-        # Map old field names to new column names
-        field_mapping = {
-            "heading": "title",
-            "pointed_analysis": "text",
-            "mains_analysis": "mains_info",
-            "prelims_info": "prelims_info",
-            "description": "description",
-            "theme_id": "news_theme_id",
-            # Direct new field names also accepted
-            "title": "title",
-            "text": "text",
-            "mains_info": "mains_info",
-            "news_theme_id": "news_theme_id",
-        }
-
+    def update_article(self, article_id: UUID, updates: Dict[str, Any]) -> bool:
+        """Update article fields with a single UPDATE; False if no such article."""
+        values = {}
         for field, value in updates.items():
-            mapped_field = field_mapping.get(field, field)
-            if hasattr(article, mapped_field):
-                setattr(article, mapped_field, value)
-
-        self.db.flush()
-        return article
-
-    def reassign_theme(
-        self, article_id: UUID, new_theme_id: UUID
-    ) -> Optional[NewsArticle]:
-        """Reassign an article to a different theme."""
-        article = (
-            self.db.query(NewsArticle).filter(NewsArticle.id == article_id).first()
+            mapped_field = ARTICLE_FIELD_MAPPING.get(field, field)
+            if mapped_field in ARTICLE_COLUMNS:
+                values[mapped_field] = value
+
+        query = self.db.query(NewsArticle).filter(NewsArticle.id == article_id)
+        if not values:
+            return self.db.query(query.exists()).scalar()
+        return query.update(values, synchronize_session=False) > 0
+
+    def reassign_theme(self, article_id: UUID, new_theme_id: UUID) -> bool:
+        """Reassign an article to a different theme; False if no such article."""
+        updated = (
+            self.db.query(NewsArticle)
+            .filter(NewsArticle.id == article_id)
+            .update({"news_theme_id": new_theme_id}, synchronize_session=False)
         )
-        if article:
-            article.news_theme_id = new_theme_id
-            self.db.flush()
-        return article
+        return updated > 0
 
     def get_article_count(
         self,
         theme_id: Optional[UUID] = None,
         search: Optional[str] = None,
     ) -> int:
-        """Get total count of articles."""
+        """Get total count of articles.
+
+        Without filters this is the planner's row estimate for the table (see
+        get_estimated_article_count), not an exact count.
+        """
+        if theme_id is None and search is None:
+            estimate = self.get_estimated_article_count()
+            if estimate is not None:
+                return estimate
+
         query = self.db.query(func.count(NewsArticle.id))
 
         if theme_id:
             query = query.filter(NewsArticle.news_theme_id == theme_id)
 
         if search:
-            query = query.filter(NewsArticle.title.ilike(f"%{search}%"))
+            query = query.filter(title_search_filter(search))
 
         return query.scalar() or 0
 
-    def get_articles_by_theme(self, theme_id: UUID) -> List[NewsArticle]:
-        """Get all articles for a specific theme."""
-        return (
-            self.db.query(NewsArticle)
-            .filter(NewsArticle.news_theme_id == theme_id)
-            .order_by(NewsArticle.date.desc())
-            .all()
-        )
+    def get_estimated_article_count(self) -> Optional[int]:
+        """Estimated number of articles from pg_class.reltuples.
+
+        Costs one catalog lookup instead of a full table scan. Returns None
+        while the table has never been vacuumed or analyzed.
+        """
+        estimate = self.db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": NewsArticle.__tablename__},
+        ).scalar()
+        if estimate is None or estimate < 0:
+            return None
+        return estimate
+
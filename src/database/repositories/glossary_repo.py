@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
+from datetime import date, datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, or_, tuple_
 
 from src.database.models import Glossary, ArticleKeyword, NewsArticle
 
@@ -10,13 +11,12 @@ class GlossaryRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all_keywords(
+    def _keywords_query(
         self,
         search: Optional[str] = None,
-        limit: int = 50,
-        offset: int = 0,
-    ) -> List[dict]:
-        """Get all glossary keywords."""
+        after: Optional[Tuple[Optional[datetime], UUID]] = None,
+    ):
+        """Keywords with article counts, ordered for keyset paging (see get_all_keywords)."""
         query = (
             self.db.query(
                 Glossary.id,
@@ -32,49 +32,119 @@ class GlossaryRepository:
         if search:
             query = query.filter(Glossary.keyword.ilike(f"%{search}%"))
 
+        if after:
+            after_created, after_id = after
+            if after_created is None:
+                query = query.filter(
+                    Glossary.created_at.is_(None), Glossary.id < after_id
+                )
+            else:
+                query = query.filter(
+                    or_(
+                        tuple_(Glossary.created_at, Glossary.id) < tuple_(after_created, after_id),
+                        Glossary.created_at.is_(None),
+                    )
+                )
+
+        return query.order_by(Glossary.created_at.desc().nulls_last(), Glossary.id.desc())
+
+    @staticmethod
+    def _keyword_rows_to_dicts(results) -> List[dict]:
+        """Rows of the keyword query as dicts; the selected columns carry the keys."""
+        return [dict(r._mapping) for r in results]
+
+    def get_all_keywords(
+        self,
+        search: Optional[str] = None,
+        limit: int = 50,
+        after: Optional[Tuple[Optional[datetime], UUID]] = None,
+    ) -> List[dict]:
+        """Get glossary keywords, newest first.
+
+        To page, pass the (created_at, id) of the last row seen as ``after``
+        (keyset pagination). Keywords without a created_at sort last.
+        """
+        results = self._keywords_query(search, after).limit(limit).all()
+        return self._keyword_rows_to_dicts(results)
+
+    def get_all_keywords_with_count(
+        self,
+        search: Optional[str] = None,
+        limit: int = 50,
+        after: Optional[Tuple[Optional[datetime], UUID]] = None,
+    ) -> Tuple[List[dict], int]:
+        """Get a page of keywords plus the number of matching keywords, in one query.
+
+        The count comes from COUNT(*) OVER () and covers every keyword that
+        matches the filters, including ``after``, before LIMIT applies.
+        """
         results = (
-            query.order_by(Glossary.created_at.desc()).offset(offset).limit(limit).all()
+            self._keywords_query(search, after)
+            .add_columns(func.count().over().label("total_count"))
+            .limit(limit)
+            .all()
         )
-
-        return [
-            {
-                "id": r.id,
-                "keyword": r.keyword,
-                "definition": r.definition,
-                "created_at": r.created_at,
-                "article_count": r.article_count,
-            }
-            for r in results
-        ]
+        total = results[0].total_count if results else 0
+        keywords = self._keyword_rows_to_dicts(results)
+        for keyword in keywords:
+            del keyword["total_count"]
+        return keywords, total
 
     def get_keyword_by_id(self, keyword_id: UUID) -> Optional[Glossary]:
         """Get a single keyword by ID."""
-        return self.db.query(Glossary).filter(Glossary.id == keyword_id).first()
+        return self.db.get(Glossary, keyword_id)
 
-    def get_keyword_with_articles(self, keyword_id: UUID) -> Optional[dict]:
-        """Get keyword with all articles using it."""
-        keyword = self.db.query(Glossary).filter(Glossary.id == keyword_id).first()
+    def get_keyword_with_articles(self, keyword_id: UUID, limit: int = 50) -> Optional[dict]:
+        """Get keyword with the newest ``limit`` articles using it and their total count."""
+        keyword = self.db.get(Glossary, keyword_id)
         if not keyword:
             return None
 
-        articles = (
-            self.db.query(NewsArticle)
-            .join(
-                ArticleKeyword,
-                ArticleKeyword.article_id == NewsArticle.id,
+        articles, article_count = self.list_keyword_articles(keyword_id, limit=limit)
+
+        return {"keyword": keyword, "articles": articles, "article_count": article_count}
+
+    def list_keyword_articles(
+        self,
+        keyword_id: UUID,
+        limit: int = 50,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> Tuple[List[dict], int]:
+        """Get a page of the articles using a keyword, newest first, plus the number of them.
+
+        To page, pass the (date, id) of the last row seen as ``after``; the
+        count then covers only the articles after it.
+        """
+        query = (
+            self.db.query(
+                NewsArticle.id,
+                NewsArticle.title.label("heading"),
+                NewsArticle.date,
+                func.count().over().label("total_count"),
             )
+            .join(ArticleKeyword, ArticleKeyword.article_id == NewsArticle.id)
             .filter(ArticleKeyword.keyword_id == keyword_id)
-            .order_by(NewsArticle.date.desc())
-            .all()
         )
 
-        return {"keyword": keyword, "articles": articles}
+        if after:
+            query = query.filter(tuple_(NewsArticle.date, NewsArticle.id) < tuple_(*after))
+
+        results = (
+            query.order_by(NewsArticle.date.desc(), NewsArticle.id.desc())
+            .limit(limit)
+            .all()
+        )
+        total = results[0].total_count if results else 0
+        articles = [dict(r._mapping) for r in results]
+        for article in articles:
+            del article["total_count"]
+        return articles, total
 
     def update_definition(
         self, keyword_id: UUID, new_definition: str
     ) -> Optional[Glossary]:
         """Update keyword definition."""
-        keyword = self.db.query(Glossary).filter(Glossary.id == keyword_id).first()
+        keyword = self.db.get(Glossary, keyword_id)
         if keyword:
             keyword.definition = new_definition
             self.db.flush()
@@ -84,7 +154,7 @@ class GlossaryRepository:
         self, keyword_id: UUID, new_keyword: str, new_definition: str
     ) -> Optional[Glossary]:
         """Update keyword name and definition."""
-        keyword = self.db.query(Glossary).filter(Glossary.id == keyword_id).first()
+        keyword = self.db.get(Glossary, keyword_id)
         if keyword:
             keyword.keyword = new_keyword
             keyword.definition = new_definition
@@ -125,15 +195,7 @@ class GlossaryRepository:
             .filter(ArticleKeyword.article_id == article_uuid)
             .all()
         )
-
-        return [
-            {
-                "id": r.id,
-                "keyword": r.keyword,
-                "definition": r.definition,
-            }
-            for r in results
-        ]
+        return self._keyword_rows_to_dicts(results)
 
     def add_keyword_to_article(
         self, article_uuid: UUID, keyword_id: UUID
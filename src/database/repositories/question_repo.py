@@ -1,11 +1,30 @@
 from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, or_, select, update
 from sqlalchemy.sql import func
 
 from src.database.models import MCQ, ItemRelation, NewsArticle, NewsTheme, LearningItem
 
 
+# Columns of the question dicts returned by the list methods, labelled with their keys
+QUESTION_COLUMNS = (
+    MCQ.id.label("question_id"),
+    MCQ.question_text,
+    MCQ.options,
+    MCQ.correct_option_ids,
+    MCQ.is_multi_select,
+    MCQ.learning_item_id,
+    MCQ.explanation,
+    MCQ.silly_mistake_prone,
+    MCQ.question_pattern,
+    MCQ.created_at,
+)
+
+# Mapped column attributes update_question may set
+MCQ_COLUMNS = frozenset(MCQ.__mapper__.column_attrs.keys())
+
+
 class QuestionRepository:
     def __init__(self, db: Session):
         self.db = db
@@ -16,86 +35,54 @@ class QuestionRepository:
         Join path: MCQ.learningItemId = ItemRelation.targetItemId
                    ItemRelation.sourceItemId = article's learningItemId
         """
-        questions = (
-            self.db.query(MCQ)
+        stmt = (
+            select(*QUESTION_COLUMNS)
             .join(ItemRelation, ItemRelation.target_item_id == MCQ.learning_item_id)
-            .filter(ItemRelation.source_item_id == learning_item_id)
+            .where(ItemRelation.source_item_id == learning_item_id)
             .order_by(MCQ.question_pattern, MCQ.created_at)
-            .all()
         )
-
-        return [
-            {
-                "question_id": q.id,
-                "question_text": q.question_text,
-                "options": q.options,
-                "correct_option_ids": q.correct_option_ids,
-                "is_multi_select": q.is_multi_select,
-                "learning_item_id": q.learning_item_id,
-                "explanation": q.explanation,
-                "silly_mistake_prone": q.silly_mistake_prone,
-                "question_pattern": q.question_pattern,
-                "created_at": q.created_at,
-            }
-            for q in questions
-        ]
+        return [dict(row) for row in self.db.execute(stmt).mappings()]
 
     def get_question_by_id(self, question_id: UUID) -> Optional[MCQ]:
         """Get a single MCQ by ID."""
-        return (
-            self.db.query(MCQ)
-            .filter(MCQ.id == question_id)
-            .first()
-        )
+        return self.db.get(MCQ, question_id)
 
     def get_questions_by_date(self, target_date=None, question_type: Optional[str] = None, theme_id: Optional[UUID] = None) -> List[dict]:
         """Get MCQs with optional date, type, and theme filters.
 
-        Join path: mcqs -> item_relations -> news_articles -> news_themes
+        Join path: news_articles -> item_relations -> mcqs, plus news_themes.
+        The date and theme filters apply to news_articles, so it leads.
         """
-        query = (
-            self.db.query(MCQ, NewsArticle.title.label("heading"), NewsTheme.name.label("theme_name"))
-            .join(ItemRelation, ItemRelation.target_item_id == MCQ.learning_item_id)
-            .join(NewsArticle, NewsArticle.learning_item_id == ItemRelation.source_item_id)
+        stmt = (
+            select(
+                *QUESTION_COLUMNS,
+                NewsArticle.title.label("article_heading"),
+                NewsTheme.name.label("theme_name"),
+            )
+            .select_from(NewsArticle)
+            .join(ItemRelation, ItemRelation.source_item_id == NewsArticle.learning_item_id)
+            .join(MCQ, MCQ.learning_item_id == ItemRelation.target_item_id)
             .outerjoin(NewsTheme, NewsTheme.id == NewsArticle.news_theme_id)
         )
 
         if target_date:
-            query = query.filter(NewsArticle.date == target_date)
+            stmt = stmt.where(NewsArticle.date == target_date)
 
         if question_type:
-            query = query.filter(MCQ.question_pattern == question_type)
+            stmt = stmt.where(MCQ.question_pattern == question_type)
 
         if theme_id:
-            query = query.filter(NewsArticle.news_theme_id == theme_id)
-
-        query = query.order_by(MCQ.question_pattern, MCQ.created_at)
-        results = query.all()
-
-        return [
-            {
-                "question_id": q.id,
-                "article_heading": heading,
-                "theme_name": theme_name,
-                "question_text": q.question_text,
-                "options": q.options,
-                "correct_option_ids": q.correct_option_ids,
-                "is_multi_select": q.is_multi_select,
-                "learning_item_id": q.learning_item_id,
-                "explanation": q.explanation,
-                "silly_mistake_prone": q.silly_mistake_prone,
-                "question_pattern": q.question_pattern,
-                "created_at": q.created_at,
-            }
-            for q, heading, theme_name in results
-        ]
+            stmt = stmt.where(NewsArticle.news_theme_id == theme_id)
+
+        stmt = stmt.order_by(MCQ.question_pattern, MCQ.created_at)
+        return [dict(row) for row in self.db.execute(stmt).mappings()]
 
     def update_question(self, question_id: UUID, updates: dict) -> Optional[MCQ]:
         """Update an MCQ's fields."""
         question = self.get_question_by_id(question_id)
         if question:
             for key, value in updates.items():
-                if hasattr(question, key):
+                if key in MCQ_COLUMNS:
                     setattr(question, key, value)
             self.db.flush()
         return question
@@ -105,34 +92,35 @@ class QuestionRepository:
 
         Only touches learning_items with purpose = 'article-generated-questions'
         or purpose = 'daily-selected'. Never touches NULL purpose rows.
+        Returns the number of learning items whose purpose changed; saving
+        the current selection again changes nothing and returns 0.
         """
-        # Get learning_item_ids for the selected MCQs
-        selected_li_ids = (
-            self.db.query(MCQ.learning_item_id)
-            .filter(MCQ.id.in_(mcq_ids))
-            .all()
+        # Learning items of the selected MCQs
+        selected_li_ids = select(MCQ.learning_item_id).where(MCQ.id.in_(mcq_ids))
+        is_selected = LearningItem.id.in_(selected_li_ids)
+
+        # One UPDATE over the rows whose state flips: deselected
+        # 'daily-selected' items go back to 'article-generated-questions',
+        # newly selected ones become 'daily-selected'
+        stmt = (
+            update(LearningItem)
+            .where(
+                or_(
+                    and_(LearningItem.purpose == "daily-selected", ~is_selected),
+                    and_(LearningItem.purpose == "article-generated-questions", is_selected),
+                )
+            )
+            .values(
+                purpose=case(
+                    (is_selected, "daily-selected"),
+                    else_="article-generated-questions",
+                )
+            )
         )
-        selected_li_ids = [row[0] for row in selected_li_ids]
-
-        # Reset all current 'daily-selected' back to 'article-generated-questions'
-        self.db.query(LearningItem).filter(
-            LearningItem.purpose == "daily-selected"
-        ).update(
-            {"purpose": "article-generated-questions"},
-            synchronize_session="fetch",
+        result = self.db.execute(
+            stmt, execution_options={"synchronize_session": False}
         )
-
-        # Mark the selected ones as 'daily-selected'
-        if selected_li_ids:
-            self.db.query(LearningItem).filter(
-                LearningItem.id.in_(selected_li_ids),
-                LearningItem.purpose == "article-generated-questions",
-            ).update(
-                {"purpose": "daily-selected"},
-                synchronize_session="fetch",
-            )
-
-        return len(selected_li_ids)
+        return result.rowcount
 
     def get_daily_selected_ids(self) -> set:
         """Get MCQ IDs that are currently marked as daily-selected."""
@@ -0,0 +1,23 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func, select
+
+from src.database.models import NewsTheme, NewsArticle, Glossary
+
+
+class StatsRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_dashboard_counts(self) -> dict:
+        """Get theme, article and glossary counts in a single query."""
+        row = self.db.query(
+            select(func.count(NewsTheme.id)).scalar_subquery().label("themes"),
+            select(func.count(NewsArticle.id)).scalar_subquery().label("articles"),
+            select(func.count(Glossary.id)).scalar_subquery().label("definitions"),
+        ).one()
+
+        return {
+            "themes": row.themes or 0,
+            "articles": row.articles or 0,
+            "definitions": row.definitions or 0,
+        }
@@ -1,16 +1,137 @@
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 from datetime import date
-from sqlalchemy.orm import Session
-from sqlalchemy import func, cast, Date as SQLDate
+from sqlalchemy.orm import Session, aliased, raiseload
+from sqlalchemy import Double, cast, func, select, true, tuple_, update
 
 from src.database.models import NewsTheme, NewsArticle
 
 
+def theme_name_search(search: str):
+    """Full-text filter and rank for theme names, prefix-matching each search word.
+
+    Uses the to_tsvector('simple', name) expression so the GIN index on it
+    applies. Falls back to ILIKE, with no rank, when the search has no word
+    characters.
+    """
+    words = re.findall(r"[^\W_]+", search)
+    if not words:
+        return NewsTheme.name.ilike(f"%{search}%"), None
+    name_tsv = func.to_tsvector("simple", NewsTheme.name)
+    tsquery = func.to_tsquery("simple", " & ".join(f"{word}:*" for word in words))
+    return name_tsv.op("@@")(tsquery), func.ts_rank_cd(name_tsv, tsquery)
+
+
 class ThemeRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    def _article_counts_subquery(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ):
+        """Articles per theme, aggregated once over news_articles."""
+        query = self.db.query(
+            NewsArticle.news_theme_id, func.count().label("article_count")
+        ).filter(NewsArticle.news_theme_id.isnot(None))
+
+        if start_date:
+            query = query.filter(NewsArticle.date >= start_date)
+        if end_date:
+            query = query.filter(NewsArticle.date <= end_date)
+
+        return query.group_by(NewsArticle.news_theme_id).subquery()
+
+    @staticmethod
+    def _keyset_order(query, sort_keys, search_rank=None, after: Optional[tuple] = None):
+        """Order a theme query by sort_keys, all descending, for keyset paging.
+
+        With a search rank, it leads the order and is selected as
+        "search_rank" so theme_page_cursor() can put it in the cursor. With
+        ``after``, only rows past that cursor are kept.
+        """
+        if search_rank is not None:
+            # float8, so the value read back compares equal in the next cursor
+            search_rank = cast(search_rank, Double)
+            query = query.add_columns(search_rank.label("search_rank"))
+            sort_keys = [search_rank, *sort_keys]
+
+        if after:
+            query = query.filter(tuple_(*sort_keys) < tuple_(*after))
+
+        return query.order_by(*(key.desc() for key in sort_keys))
+
+    def _all_themes_query(self, search: Optional[str] = None, after: Optional[tuple] = None):
+        """Themes with article counts, best search match first, then most articles."""
+        counts = self._article_counts_subquery()
+        article_count = func.coalesce(counts.c.article_count, 0)
+        query = self.db.query(
+            NewsTheme.id,
+            NewsTheme.name,
+            NewsTheme.created_at,
+            article_count.label("article_count"),
+        ).outerjoin(counts, counts.c.news_theme_id == NewsTheme.id)
+
+        rank = None
+        if search:
+            search_filter, rank = theme_name_search(search)
+            query = query.filter(search_filter)
+
+        return self._keyset_order(query, [article_count, NewsTheme.id], rank, after)
+
+    def _themes_by_article_date_query(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        after: Optional[tuple] = None,
+    ):
+        """Themes with articles in the date range, counting only those articles.
+
+        Ordered like _all_themes_query.
+        """
+        counts = self._article_counts_subquery(start_date, end_date)
+        query = self.db.query(
+            NewsTheme.id,
+            NewsTheme.name,
+            NewsTheme.created_at,
+            counts.c.article_count,
+        ).join(counts, counts.c.news_theme_id == NewsTheme.id)
+
+        rank = None
+        if search:
+            search_filter, rank = theme_name_search(search)
+            query = query.filter(search_filter)
+
+        return self._keyset_order(query, [counts.c.article_count, NewsTheme.id], rank, after)
+
+    @staticmethod
+    def _theme_rows_to_dicts(results) -> List[dict]:
+        """Rows of the theme queries as dicts; the selected columns carry the keys."""
+        return [dict(r._mapping) for r in results]
+
+    @staticmethod
+    def theme_page_cursor(theme: dict) -> tuple:
+        """Keyset cursor to pass as ``after`` for the themes following this row."""
+        if "search_rank" in theme:
+            return (theme["search_rank"], theme["article_count"], theme["id"])
+        return (theme["article_count"], theme["id"])
+
+    def _theme_page_with_count(self, query, limit: int) -> Tuple[List[dict], int]:
+        """One page of a theme query plus its total, via COUNT(*) OVER ()."""
+        results = (
+            query.add_columns(func.count().over().label("total_count"))
+            .limit(limit)
+            .all()
+        )
+        total = results[0].total_count if results else 0
+        themes = self._theme_rows_to_dicts(results)
+        for theme in themes:
+            del theme["total_count"]
+        return themes, total
+
     def get_all_themes(
         self,
         start_date: Optional[date] = None,
@@ -20,33 +141,21 @@ class ThemeRepository:
         offset: int = 0,
     ) -> List[dict]:
         """Get all themes with article counts."""
-        query = (
-            self.db.query(
-                NewsTheme.id,
-                NewsTheme.name,
-                NewsTheme.created_at,
-                func.count(NewsArticle.id).label("article_count"),
-            )
-            .outerjoin(NewsArticle, NewsArticle.news_theme_id == NewsTheme.id)
-            .group_by(NewsTheme.id)
-        )
+        results = self._all_themes_query(search).offset(offset).limit(limit).all()
+        return self._theme_rows_to_dicts(results)
 
-        if search:
-            query = query.filter(NewsTheme.name.ilike(f"%{search}%"))
-
-        results = (
-            query.order_by(func.count(NewsArticle.id).desc()).offset(offset).limit(limit).all()
-        )
+    def get_all_themes_with_count(
+        self,
+        search: Optional[str] = None,
+        limit: int = 50,
+        after: Optional[tuple] = None,
+    ) -> Tuple[List[dict], int]:
+        """Get a page of themes with article counts, plus the number of matching themes.
 
-        return [
-            {
-                "id": r.id,
-                "name": r.name,
-                "created_at": r.created_at,
-                "article_count": r.article_count,
-            }
-            for r in results
-        ]
+        To page, pass theme_page_cursor() of the last row seen as ``after``
+        (keyset pagination); the count then covers only the themes after it.
+        """
+        return self._theme_page_with_count(self._all_themes_query(search, after), limit)
 
     def get_themes_by_article_date(
         self,
@@ -57,139 +166,162 @@ class ThemeRepository:
         offset: int = 0,
     ) -> List[dict]:
         """Get themes that have articles within a date range."""
-        # Subquery to get theme IDs that have articles in the date range
-        article_query = self.db.query(NewsArticle.news_theme_id).filter(
-            NewsArticle.news_theme_id.isnot(None)
-        )
-
-        if start_date:
-            article_query = article_query.filter(NewsArticle.date >= start_date)
-        if end_date:
-            article_query = article_query.filter(NewsArticle.date <= end_date)
-
-        theme_ids_with_articles = article_query.distinct().subquery()
-
-        # Main query
-        query = (
-            self.db.query(
-                NewsTheme.id,
-                NewsTheme.name,
-                NewsTheme.created_at,
-                func.count(NewsArticle.id).label("article_count"),
-            )
-            .join(theme_ids_with_articles, NewsTheme.id == theme_ids_with_articles.c.news_theme_id)
-            .outerjoin(NewsArticle, NewsArticle.news_theme_id == NewsTheme.id)
-        )
-
-        # Filter articles by date for accurate count
-        if start_date:
-            query = query.filter(NewsArticle.date >= start_date)
-        if end_date:
-            query = query.filter(NewsArticle.date <= end_date)
+        query = self._themes_by_article_date_query(start_date, end_date, search)
+        results = query.offset(offset).limit(limit).all()
+        return self._theme_rows_to_dicts(results)
 
-        query = query.group_by(NewsTheme.id)
-
-        if search:
-            query = query.filter(NewsTheme.name.ilike(f"%{search}%"))
-
-        results = (
-            query.order_by(func.count(NewsArticle.id).desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
+    def get_themes_by_article_date_with_count(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        after: Optional[tuple] = None,
+    ) -> Tuple[List[dict], int]:
+        """Get a page of themes with articles in a date range, plus the number of them.
 
-        return [
-            {
-                "id": r.id,
-                "name": r.name,
-                "created_at": r.created_at,
-                "article_count": r.article_count,
-            }
-            for r in results
-        ]
+        Pages with ``after`` like get_all_themes_with_count.
+        """
+        query = self._themes_by_article_date_query(start_date, end_date, search, after)
+        return self._theme_page_with_count(query, limit)
 
     def get_theme_by_id(self, theme_id: UUID) -> Optional[NewsTheme]:
         """Get a single theme by ID."""
-        return self.db.query(NewsTheme).filter(NewsTheme.id == theme_id).first()
+        return self.db.get(NewsTheme, theme_id)
 
-    def get_theme_with_articles(self, theme_id: UUID) -> Optional[dict]:
-        """Get theme details with all associated articles."""
-        theme = self.db.query(NewsTheme).filter(NewsTheme.id == theme_id).first()
+    def get_theme_with_articles(self, theme_id: UUID, limit: int = 10) -> Optional[dict]:
+        """Get theme details with its newest ``limit`` articles and their total count.
+
+        The articles are plain rows; theme.articles is set to raise rather
+        than lazy-load the theme's full article list.
+        """
+        theme = self.db.get(NewsTheme, theme_id, options=[raiseload("*")])
         if not theme:
             return None
 
-        articles = (
-            self.db.query(NewsArticle)
-            .filter(NewsArticle.news_theme_id == theme_id)
-            .order_by(NewsArticle.date.desc())
+        articles, article_count = self.list_theme_articles(theme_id, limit=limit)
+
+        return {"theme": theme, "articles": articles, "article_count": article_count}
+
+    def list_theme_articles(
+        self,
+        theme_id: UUID,
+        limit: int = 50,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> Tuple[List[dict], int]:
+        """Get a page of a theme's articles (id, heading, date), newest first, plus the number of them.
+
+        To page, pass the (date, id) of the last row seen as ``after``; the
+        count then covers only the articles after it.
+        """
+        query = self.db.query(
+            NewsArticle.id,
+            NewsArticle.title.label("heading"),
+            NewsArticle.date,
+            func.count().over().label("total_count"),
+        ).filter(NewsArticle.news_theme_id == theme_id)
+
+        if after:
+            query = query.filter(tuple_(NewsArticle.date, NewsArticle.id) < tuple_(*after))
+
+        results = (
+            query.order_by(NewsArticle.date.desc(), NewsArticle.id.desc())
+            .limit(limit)
             .all()
         )
-
-        return {"theme": theme, "articles": articles}
+        total = results[0].total_count if results else 0
+        articles = [dict(r._mapping) for r in results]
+        for article in articles:
+            del article["total_count"]
+        return articles, total
 
     def update_theme_name(self, theme_id: UUID, new_name: str) -> Optional[NewsTheme]:
-        """Update theme name."""
-        theme = self.db.query(NewsTheme).filter(NewsTheme.id == theme_id).first()
-        if theme:
-            theme.name = new_name
-            self.db.flush()
-        return theme
+        """Update theme name with a single UPDATE ... RETURNING; None if no such theme."""
+        stmt = (
+            update(NewsTheme)
+            .where(NewsTheme.id == theme_id)
+            .values(name=new_name)
+            .returning(NewsTheme)
+        )
+        return self.db.execute(stmt).scalar_one_or_none()
 
     def merge_themes(self, source_id: UUID, target_id: UUID) -> int:
         """Merge source theme into target, reassigning all articles."""
         updated = (
             self.db.query(NewsArticle)
             .filter(NewsArticle.news_theme_id == source_id)
-            .update({"newsThemeId": target_id})
+            .update({"news_theme_id": target_id}, synchronize_session=False)
         )
 
         # Delete source theme
-        self.db.query(NewsTheme).filter(NewsTheme.id == source_id).delete()
+        self.db.query(NewsTheme).filter(NewsTheme.id == source_id).delete(
+            synchronize_session=False
+        )
 
         return updated
 
     def find_similar_themes(
         self, theme_name: str, exclude_id: UUID = None, limit: int = 5
     ) -> List[NewsTheme]:
-        """Find potentially similar themes for merge suggestions."""
-        words = theme_name.split()
-        if not words:
+        """Find potentially similar themes for merge suggestions, most similar first.
+
+        Uses pg_trgm: the % operator (trigram similarity above
+        pg_trgm.similarity_threshold, 0.3 by default) can use the trigram
+        index on news_themes.name.
+        """
+        if not theme_name.strip():
             return []
 
-        query = self.db.query(NewsTheme).filter(NewsTheme.name.ilike(f"%{words[0]}%"))
+        query = self.db.query(NewsTheme).filter(NewsTheme.name.op("%")(theme_name))
 
         if exclude_id:
             query = query.filter(NewsTheme.id != exclude_id)
 
-        return query.limit(limit).all()
+        return (
+            query.order_by(func.similarity(NewsTheme.name, theme_name).desc())
+            .limit(limit)
+            .all()
+        )
+
+    def find_similar_themes_for_many(
+        self, theme_ids: List[UUID], limit: int = 3
+    ) -> Dict[UUID, List[dict]]:
+        """Merge suggestions for several themes in one query, keyed by theme id.
+
+        Same rule as find_similar_themes, run per theme through a LATERAL
+        subquery. Each list holds up to ``limit`` {"id", "name"} dicts, most
+        similar first.
+        """
+        similar_by_theme: Dict[UUID, List[dict]] = {theme_id: [] for theme_id in theme_ids}
+        if not theme_ids:
+            return similar_by_theme
+
+        source = aliased(NewsTheme, name="source")
+        candidate = aliased(NewsTheme, name="candidate")
+        score = func.similarity(candidate.name, source.name)
+        similar = (
+            select(candidate.id, candidate.name, score.label("score"))
+            .where(candidate.name.op("%")(source.name), candidate.id != source.id)
+            .order_by(score.desc())
+            .limit(limit)
+            .lateral("similar")
+        )
+        stmt = (
+            select(source.id.label("theme_id"), similar.c.id, similar.c.name)
+            .select_from(source)
+            .join(similar, true())
+            .where(source.id.in_(theme_ids))
+            .order_by(source.id, similar.c.score.desc())
+        )
+
+        for row in self.db.execute(stmt):
+            similar_by_theme[row.theme_id].append({"id": row.id, "name": row.name})
+        return similar_by_theme
 
     def get_theme_count(self, search: Optional[str] = None) -> int:
         """Get total count of themes."""
         query = self.db.query(func.count(NewsTheme.id))
         if search:
-            query = query.filter(NewsTheme.name.ilike(f"%{search}%"))
+            query = query.filter(theme_name_search(search)[0])
         return query.scalar() or 0
 
-    def get_theme_count_by_article_date(
-        self,
-        start_date: Optional[date] = None,
-        end_date: Optional[date] = None,
-        search: Optional[str] = None,
-    ) -> int:
-        """Get count of themes that have articles within a date range."""
-        query = (
-            self.db.query(func.count(func.distinct(NewsArticle.news_theme_id)))
-            .filter(NewsArticle.news_theme_id.isnot(None))
-        )
-
-        if start_date:
-            query = query.filter(NewsArticle.date >= start_date)
-        if end_date:
-            query = query.filter(NewsArticle.date <= end_date)
-        if search:
-            query = query.join(NewsTheme, NewsTheme.id == NewsArticle.news_theme_id).filter(
-                NewsTheme.name.ilike(f"%{search}%")
-            )
-
-        return query.scalar() or 0
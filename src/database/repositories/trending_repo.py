@@ -2,9 +2,12 @@ from typing import List, Optional
 from datetime import date
 from uuid import UUID
 from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, or_, select, update
 from sqlalchemy.sql import func
 
 from src.database.models import NewsTheme, NewsArticle, MCQ, ItemRelation, LearningItem
+from src.database.repositories.question_repo import QUESTION_COLUMNS
+from src.database.repositories.theme_repo import theme_name_search
 
 
 class TrendingRepository:
@@ -17,7 +20,11 @@ class TrendingRepository:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
     ) -> List[dict]:
-        """Get news_themes with article counts, optionally filtered by article date."""
+        """Get news_themes with article counts, optionally filtered by article date.
+
+        The search matches theme names like the themes page does (see
+        theme_name_search).
+        """
         query = (
             self.db.query(
                 NewsTheme.id,
@@ -42,21 +49,11 @@ class TrendingRepository:
             query = query.having(func.count(NewsArticle.id) > 0)
 
         if search:
-            query = query.filter(NewsTheme.name.ilike(f"%{search}%"))
+            query = query.filter(theme_name_search(search)[0])
 
         results = query.order_by(func.count(NewsArticle.id).desc()).all()
 
-        return [
-            {
-                "id": r.id,
-                "name": r.name,
-                "summary": r.summary,
-                "is_trending": r.is_trending,
-                "created_at": r.created_at,
-                "article_count": r.article_count,
-            }
-            for r in results
-        ]
+        return [dict(r._mapping) for r in results]
 
     def get_currently_trending(self) -> List[dict]:
         """Get themes currently marked as trending."""
@@ -74,55 +71,44 @@ class TrendingRepository:
             .all()
         )
 
-        return [
-            {
-                "id": r.id,
-                "name": r.name,
-                "summary": r.summary,
-                "is_trending": r.is_trending,
-                "article_count": r.article_count,
-            }
-            for r in results
-        ]
+        return [dict(r._mapping) for r in results]
 
     def get_questions_for_theme(self, theme_id: UUID) -> List[dict]:
-        """Get all MCQs for articles belonging to a theme via item_relations."""
-        results = (
-            self.db.query(MCQ, NewsArticle.title)
+        """Get all MCQs for articles belonging to a theme via item_relations.
+
+        Selects columns, not MCQ entities, so there is nothing to lazy-load.
+        """
+        stmt = (
+            select(*QUESTION_COLUMNS, NewsArticle.title.label("article_title"))
             .join(ItemRelation, ItemRelation.target_item_id == MCQ.learning_item_id)
             .join(NewsArticle, NewsArticle.learning_item_id == ItemRelation.source_item_id)
-            .filter(NewsArticle.news_theme_id == theme_id)
+            .where(NewsArticle.news_theme_id == theme_id)
             .order_by(MCQ.question_pattern, MCQ.created_at)
-            .all()
         )
+        return [dict(row) for row in self.db.execute(stmt).mappings()]
 
-        return [
-            {
-                "question_id": q.id,
-                "article_title": title,
-                "question_text": q.question_text,
-                "options": q.options,
-                "correct_option_ids": q.correct_option_ids,
-                "is_multi_select": q.is_multi_select,
-                "learning_item_id": q.learning_item_id,
-                "explanation": q.explanation,
-                "question_pattern": q.question_pattern,
-                "silly_mistake_prone": q.silly_mistake_prone,
-            }
-            for q, title in results
-        ]
-
-    def save_trending_themes(self, trending_theme_ids: List[UUID]):
-        """Set selected themes as trending and unset the rest."""
-        # Unset all
-        self.db.query(NewsTheme).filter(NewsTheme.is_trending == True).update(
-            {NewsTheme.is_trending: False}, synchronize_session="fetch"
-        )
-        # Set selected
-        if trending_theme_ids:
-            self.db.query(NewsTheme).filter(NewsTheme.id.in_(trending_theme_ids)).update(
-                {NewsTheme.is_trending: True}, synchronize_session="fetch"
+    def save_trending_themes(self, trending_theme_ids: List[UUID]) -> int:
+        """Set selected themes as trending and unset the rest.
+
+        Returns the number of themes whose trending flag changed.
+        """
+        is_selected = NewsTheme.id.in_(trending_theme_ids)
+
+        # One UPDATE over the rows whose flag flips
+        stmt = (
+            update(NewsTheme)
+            .where(
+                or_(
+                    and_(NewsTheme.is_trending == True, ~is_selected),
+                    and_(NewsTheme.is_trending == False, is_selected),
+                )
             )
+            .values(is_trending=case((is_selected, True), else_=False))
+        )
+        result = self.db.execute(
+            stmt, execution_options={"synchronize_session": False}
+        )
+        return result.rowcount
 
     def auto_select_daily_questions(self, target_date: date) -> int:
         """Mark all of today's MCQs as daily-selected, reset previous ones.
@@ -132,38 +118,33 @@ class TrendingRepository:
         3. Mark those as 'daily-selected'
 
         Never touches NULL-purpose or daily-challenges learning_items.
+        Both steps run as UPDATEs in the database; no ids are fetched.
+        Returns the number of learning items marked.
         """
         # Step 1: Reset previous daily-selected
-        self.db.query(LearningItem).filter(
-            LearningItem.purpose == "daily-selected"
-        ).update(
-            {"purpose": "article-generated-questions"},
-            synchronize_session="fetch",
+        self.db.execute(
+            update(LearningItem)
+            .where(LearningItem.purpose == "daily-selected")
+            .values(purpose="article-generated-questions"),
+            execution_options={"synchronize_session": False},
         )
 
-        # Step 2: Find today's MCQ learning_item_ids
+        # Step 2: Today's MCQ learning_item_ids
         today_li_ids = (
-            self.db.query(MCQ.learning_item_id)
+            select(MCQ.learning_item_id)
             .join(ItemRelation, ItemRelation.target_item_id == MCQ.learning_item_id)
             .join(NewsArticle, NewsArticle.learning_item_id == ItemRelation.source_item_id)
-            .join(LearningItem, LearningItem.id == MCQ.learning_item_id)
-            .filter(
-                NewsArticle.date == target_date,
-                LearningItem.purpose == "article-generated-questions",
-            )
-            .distinct()
-            .all()
+            .where(NewsArticle.date == target_date)
         )
-        li_ids = [row[0] for row in today_li_ids]
 
         # Step 3: Mark as daily-selected
-        if li_ids:
-            self.db.query(LearningItem).filter(
-                LearningItem.id.in_(li_ids),
+        result = self.db.execute(
+            update(LearningItem)
+            .where(
+                LearningItem.id.in_(today_li_ids),
                 LearningItem.purpose == "article-generated-questions",
-            ).update(
-                {"purpose": "daily-selected"},
-                synchronize_session="fetch",
             )
-
-        return len(li_ids)
+            .values(purpose="daily-selected"),
+            execution_options={"synchronize_session": False},
+        )
+        return result.rowcount
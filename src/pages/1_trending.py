@@ -1,8 +1,4 @@
-import sys
-from pathlib import Path
-from datetime import datetime, timedelta
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from datetime import datetime
 
 import streamlit as st
 from uuid import UUID
@@ -10,6 +6,7 @@ from src.config import settings
 from src.utils.session_state import init_session_state, show_messages, set_success
 from src.database.connection import get_db
 from src.database.repositories.trending_repo import TrendingRepository
+from src.components.sidebar import resolve_date_filter
 
 st.set_page_config(
     page_title=f"Trending - {settings.APP_NAME}",
@@ -26,9 +23,9 @@ with st.expander("📋 Workflow Guide", expanded=False):
     st.markdown("""
 **Select 5 Trending Themes**
 - Use the date filter (sidebar) to view today's themes
-- Browse themes and check the ones most relevant for today
+- Browse themes and tick **Trending** for the ones most relevant for today
 - Select exactly **5 themes** and click **Save Trending Themes**
-- Click on a theme to preview its questions and summary
+- Pick a theme under **Preview theme** to see its questions and summary
 """)
 
 st.markdown("---")
@@ -83,31 +80,10 @@ if custom_date != st.session_state.trend_custom_date_value:
 # Default to today
 date_filter = st.session_state.get("trend_date_filter", "today")
 
-if date_filter == "custom":
-    start_date = st.session_state.trend_custom_date_value
-    end_date = st.session_state.trend_custom_date_value
-    st.sidebar.caption(f"Showing themes with articles from {start_date.strftime('%d %b %Y')}")
-elif date_filter == "today":
-    start_date = today
-    end_date = today
-    st.sidebar.caption(f"Showing themes with articles from today ({today.strftime('%d %b')})")
-elif date_filter == "yesterday":
-    yesterday = today - timedelta(days=1)
-    start_date = yesterday
-    end_date = yesterday
-    st.sidebar.caption(f"Showing themes with articles from yesterday ({yesterday.strftime('%d %b')})")
-elif date_filter == "week":
-    start_date = today - timedelta(days=7)
-    end_date = today
-    st.sidebar.caption("Showing themes with articles from last 7 days")
-elif date_filter == "month":
-    start_date = today - timedelta(days=30)
-    end_date = today
-    st.sidebar.caption("Showing themes with articles from last 30 days")
-else:
-    start_date = None
-    end_date = None
-    st.sidebar.caption("Showing all themes")
+start_date, end_date, date_caption = resolve_date_filter(
+    date_filter, st.session_state.trend_custom_date_value, today
+)
+st.sidebar.caption(date_caption)
 
 # Search
 search = st.sidebar.text_input(
@@ -136,28 +112,91 @@ def get_english_text(content):
     return str(content)
 
 
-def toggle_trending(theme_id_str):
-    if theme_id_str in st.session_state.selected_trending:
-        st.session_state.selected_trending.discard(theme_id_str)
-    else:
-        st.session_state.selected_trending.add(theme_id_str)
-
+@st.cache_data(ttl=60, show_spinner=False)
+def load_trending_themes(search, start_date, end_date):
+    """Themes with article counts for the current filters, cached across reruns.
 
-try:
+    Keyed by theme id string, in the repository's order (most articles first).
+    """
     with get_db() as db:
         trending_repo = TrendingRepository(db)
-        all_themes = trending_repo.get_themes_with_article_count(
-            search=search if search else None,
+        themes = trending_repo.get_themes_with_article_count(
+            search=search,
             start_date=start_date,
             end_date=end_date,
         )
+    return {str(t["id"]): t for t in themes}
 
-    # On first load, pre-select currently trending themes
-    if "trending_initialized" not in st.session_state:
-        st.session_state.selected_trending = {
-            str(t["id"]) for t in all_themes if t["is_trending"]
+
+@st.cache_data(ttl=300, max_entries=200, show_spinner=False)
+def load_theme_questions(theme_id):
+    """Questions for one theme's articles, cached per theme."""
+    with get_db() as db:
+        trending_repo = TrendingRepository(db)
+        return trending_repo.get_questions_for_theme(UUID(theme_id))
+
+
+# Questions rendered at first, and added per "Show more", in the detail pane
+QUESTIONS_WINDOW = 25
+
+
+def show_more_questions(window_key):
+    st.session_state[window_key] += QUESTIONS_WINDOW
+
+
+def new_trending_table(theme_ids, rows):
+    """Start a fresh theme table whose Trending column shows the current selection."""
+    version = st.session_state.get("trending_table_version", 0) + 1
+    st.session_state.trending_table_version = version
+    st.session_state.trending_table = {
+        "key": f"trending_table_{version}",
+        "theme_ids": theme_ids,
+        "rows": rows,
+        "base": frozenset(st.session_state.selected_trending),
+    }
+
+
+def apply_trending_edits():
+    """Fold the table's checkbox edits into selected_trending."""
+    table = st.session_state.trending_table
+    edited_rows = st.session_state[table["key"]]["edited_rows"]
+    checked = {
+        t_id
+        for i, t_id in enumerate(table["theme_ids"])
+        if edited_rows.get(i, {}).get("Trending", t_id in table["base"])
+    }
+    # Themes selected under other filters stay selected
+    st.session_state.selected_trending = (
+        st.session_state.selected_trending - set(table["theme_ids"])
+    ) | checked
+
+
+def clear_trending(theme_ids, rows):
+    st.session_state.selected_trending = set()
+    new_trending_table(theme_ids, rows)
+
+
+@st.fragment
+def render_trending_selector(themes_by_id):
+    """Selection counter, save buttons, theme list and detail pane.
+
+    Ticking a theme or opening one reruns only this fragment, not the
+    filters and theme query above it.
+    """
+    theme_ids = tuple(themes_by_id)
+    rows = [
+        {
+            "Theme": theme["name"] + (" 🔥" if theme["is_trending"] else ""),
+            "Articles": theme["article_count"],
         }
-        st.session_state.trending_initialized = True
+        for theme in themes_by_id.values()
+    ]
+    # A new table (new widget key) whenever the rows change, so the editor's
+    # edits always apply to the rows and selection it started from
+    table = st.session_state.get("trending_table")
+    if table is None or table["theme_ids"] != theme_ids or table["rows"] != rows:
+        new_trending_table(theme_ids, rows)
+        table = st.session_state.trending_table
 
     selected = st.session_state.selected_trending
     num_selected = len(selected)
@@ -185,82 +224,77 @@ try:
                     [UUID(tid) for tid in selected]
                 )
                 num_daily = trending_repo.auto_select_daily_questions(today)
+            load_trending_themes.clear()
             set_success(f"Trending themes saved! {num_daily} questions marked as daily-selected.")
             st.rerun()
     with col_clear:
-        if st.button("Clear Selection", use_container_width=True):
-            st.session_state.selected_trending = set()
-            st.rerun()
+        st.button(
+            "Clear Selection",
+            use_container_width=True,
+            on_click=clear_trending,
+            args=(theme_ids, rows),
+        )
 
     st.markdown("---")
 
-    if not all_themes:
+    if not themes_by_id:
         st.info("No themes found for the selected date range.")
     else:
         # Two column layout: theme list | questions detail
         col_list, col_detail = st.columns([1, 2])
 
         with col_list:
-            st.markdown(f"### Themes ({len(all_themes)})")
-
-            for theme in all_themes:
-                t_id = str(theme["id"])
-                is_selected = t_id in selected
-
-                with st.container(border=True):
-                    col_check, col_name = st.columns([0.5, 9.5])
-
-                    with col_check:
-                        st.checkbox(
-                            "sel",
-                            value=is_selected,
-                            key=f"trend_sel_{t_id}",
-                            on_change=toggle_trending,
-                            args=(t_id,),
-                            label_visibility="collapsed",
-                        )
-
-                    with col_name:
-                        label = f"**{theme['name']}** ({theme['article_count']} articles)"
-                        if theme["is_trending"]:
-                            label += " 🔥"
-                        if st.button(
-                            label,
-                            key=f"trend_view_{t_id}",
-                            use_container_width=True,
-                        ):
-                            st.session_state.trending_detail_theme = t_id
-                            st.rerun()
+            st.markdown(f"### Themes ({len(themes_by_id)})")
+
+            # One editable table instead of a checkbox and a button per theme
+            st.data_editor(
+                [
+                    {"Trending": t_id in table["base"], **row}
+                    for t_id, row in zip(theme_ids, rows)
+                ],
+                key=table["key"],
+                on_change=apply_trending_edits,
+                column_config={"Trending": st.column_config.CheckboxColumn(width="small")},
+                disabled=["Theme", "Articles"],
+                hide_index=True,
+                use_container_width=True,
+            )
 
         with col_detail:
-            detail_id = st.session_state.trending_detail_theme
+            if st.session_state.trending_detail_theme not in themes_by_id:
+                st.session_state.trending_detail_theme = None
+            detail_id = st.selectbox(
+                "Preview theme",
+                options=[None, *theme_ids],
+                format_func=lambda t_id: "Select a theme..." if t_id is None else themes_by_id[t_id]["name"],
+                key="trending_detail_theme",
+            )
 
             if detail_id:
-                # Find theme info
-                theme_info = next((t for t in all_themes if str(t["id"]) == detail_id), None)
-
-                if theme_info:
-                    st.subheader(f"{theme_info['name']}")
-                    is_cur_trending = str(theme_info["id"]) in selected
-                    status_label = "Selected as trending" if is_cur_trending else "Not selected"
-                    st.caption(f"{theme_info['article_count']} articles | {status_label}")
-
-                    if theme_info.get("summary"):
-                        with st.expander("Theme Summary", expanded=False):
-                            st.markdown(theme_info["summary"])
-
-                    # Fetch questions for this theme
-                    with get_db() as db:
-                        trending_repo = TrendingRepository(db)
-                        questions = trending_repo.get_questions_for_theme(UUID(detail_id))
-
-                    st.markdown("---")
-                    st.markdown(f"### Questions ({len(questions)})")
-
-                    if not questions:
-                        st.info("No questions found for this theme")
-                    else:
-                        for i, q in enumerate(questions):
+                theme_info = themes_by_id[detail_id]
+                st.subheader(f"{theme_info['name']}")
+                is_cur_trending = detail_id in selected
+                status_label = "Selected as trending" if is_cur_trending else "Not selected"
+                st.caption(f"{theme_info['article_count']} articles | {status_label}")
+
+                if theme_info.get("summary"):
+                    with st.expander("Theme Summary", expanded=False):
+                        st.markdown(theme_info["summary"])
+
+                # Fetch questions for this theme
+                questions = load_theme_questions(detail_id)
+
+                st.markdown("---")
+                st.markdown(f"### Questions ({len(questions)})")
+
+                if not questions:
+                    st.info("No questions found for this theme")
+                else:
+                    # Render a window of questions in a scrolling box, extended by "Show more"
+                    window_key = f"trend_questions_shown_{detail_id}"
+                    shown = st.session_state.setdefault(window_key, QUESTIONS_WINDOW)
+                    with st.container(height=600):
+                        for i, q in enumerate(questions[:shown]):
                             with st.container(border=True):
                                 st.caption(f"From: {q.get('article_title', 'Unknown')}")
                                 st.markdown(f"**Q{i+1}.** {q.get('question_text', '')}")
@@ -281,10 +315,29 @@ try:
                                 if explanation:
                                     with st.expander("Explanation", expanded=False):
                                         st.markdown(get_english_text(explanation))
-                else:
-                    st.info("Theme not found in current filter. Try changing the date range.")
+
+                    if shown < len(questions):
+                        st.button(
+                            f"Show {min(QUESTIONS_WINDOW, len(questions) - shown)} more",
+                            key=f"trend_questions_more_{detail_id}",
+                            on_click=show_more_questions,
+                            args=(window_key,),
+                        )
             else:
-                st.info("👈 Select a theme to view its questions")
+                st.info("Pick a theme above to view its questions")
+
+
+try:
+    themes_by_id = load_trending_themes(search if search else None, start_date, end_date)
+
+    # On first load, pre-select currently trending themes
+    if "trending_initialized" not in st.session_state:
+        st.session_state.selected_trending = {
+            t_id for t_id, t in themes_by_id.items() if t["is_trending"]
+        }
+        st.session_state.trending_initialized = True
+
+    render_trending_selector(themes_by_id)
 
 except Exception as e:
     st.error(f"Error: {str(e)}")
@@ -1,8 +1,4 @@
-import sys
-from pathlib import Path
-from datetime import datetime, timedelta
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from datetime import datetime
 
 import streamlit as st
 from uuid import UUID
@@ -11,8 +7,9 @@ from src.utils.session_state import init_session_state, show_messages, set_succe
 from src.database.connection import get_db
 from src.database.repositories.theme_repo import ThemeRepository
 from src.database.repositories.timeline_repo import TimelineRepository
-from src.services.verification_service import ContentService
-from src.components.sidebar import render_pagination
+from src.services.verification_service import get_content_service
+from src.services.loaders import load_all_themes
+from src.components.sidebar import get_page_cursor, render_cursor_pagination, resolve_date_filter
 
 st.set_page_config(
     page_title=f"Themes - {settings.APP_NAME}",
@@ -35,25 +32,20 @@ col1, col2 = st.sidebar.columns(2)
 with col1:
     if st.sidebar.button("Today", use_container_width=True, key="theme_today"):
         st.session_state.theme_date_filter = "today"
-        st.session_state.current_page = 1
         st.rerun()
     if st.sidebar.button("This Week", use_container_width=True, key="theme_week"):
         st.session_state.theme_date_filter = "week"
-        st.session_state.current_page = 1
         st.rerun()
 with col2:
     if st.sidebar.button("Yesterday", use_container_width=True, key="theme_yesterday"):
         st.session_state.theme_date_filter = "yesterday"
-        st.session_state.current_page = 1
         st.rerun()
     if st.sidebar.button("This Month", use_container_width=True, key="theme_month"):
         st.session_state.theme_date_filter = "month"
-        st.session_state.current_page = 1
         st.rerun()
 
 if st.sidebar.button("Show All", use_container_width=True, key="theme_all"):
     st.session_state.theme_date_filter = "all"
-    st.session_state.current_page = 1
     st.rerun()
 
 # Date picker for custom date
@@ -73,36 +65,14 @@ custom_date = st.sidebar.date_input(
 if custom_date != st.session_state.theme_custom_date_value:
     st.session_state.theme_custom_date_value = custom_date
     st.session_state.theme_date_filter = "custom"
-    st.session_state.current_page = 1
 
 # Determine date range based on filter (default to "all")
 date_filter = st.session_state.get("theme_date_filter", "all")
 
-if date_filter == "custom":
-    start_date = st.session_state.theme_custom_date_value
-    end_date = st.session_state.theme_custom_date_value
-    st.sidebar.caption(f"Showing themes with articles from {start_date.strftime('%d %b %Y')}")
-elif date_filter == "today":
-    start_date = today
-    end_date = today
-    st.sidebar.caption(f"Showing themes with articles from today ({today.strftime('%d %b')})")
-elif date_filter == "yesterday":
-    yesterday = today - timedelta(days=1)
-    start_date = yesterday
-    end_date = yesterday
-    st.sidebar.caption(f"Showing themes with articles from yesterday ({yesterday.strftime('%d %b')})")
-elif date_filter == "week":
-    start_date = today - timedelta(days=7)
-    end_date = today
-    st.sidebar.caption(f"Showing themes with articles from last 7 days")
-elif date_filter == "month":
-    start_date = today - timedelta(days=30)
-    end_date = today
-    st.sidebar.caption(f"Showing themes with articles from last 30 days")
-else:
-    start_date = None
-    end_date = None
-    st.sidebar.caption("Showing all themes")
+start_date, end_date, date_caption = resolve_date_filter(
+    date_filter, st.session_state.theme_custom_date_value, today
+)
+st.sidebar.caption(date_caption)
 
 # Search
 search = st.sidebar.text_input(
@@ -113,36 +83,71 @@ search = st.sidebar.text_input(
 )
 
 # Service
-content_service = ContentService()
+content_service = get_content_service()
 
-try:
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_theme_page(start_date, end_date, search, cursor):
+    """One page of themes ranked by article count (plus one look-ahead row) and the remaining count."""
     with get_db() as db:
         theme_repo = ThemeRepository(db)
 
         # Get themes based on article dates
         if start_date or end_date:
-            themes = theme_repo.get_themes_by_article_date(
-                start_date=start_date,
-                end_date=end_date,
-                search=search if search else None,
-                limit=settings.DEFAULT_PAGE_SIZE,
-                offset=(st.session_state.current_page - 1) * settings.DEFAULT_PAGE_SIZE,
-            )
-            total_themes = theme_repo.get_theme_count_by_article_date(
+            return theme_repo.get_themes_by_article_date_with_count(
                 start_date=start_date,
                 end_date=end_date,
-                search=search if search else None,
-            )
-        else:
-            themes = theme_repo.get_all_themes(
-                search=search if search else None,
-                limit=settings.DEFAULT_PAGE_SIZE,
-                offset=(st.session_state.current_page - 1) * settings.DEFAULT_PAGE_SIZE,
+                search=search,
+                limit=settings.DEFAULT_PAGE_SIZE + 1,
+                after=cursor,
             )
-            total_themes = theme_repo.get_theme_count(search=search if search else None)
+        return theme_repo.get_all_themes_with_count(
+            search=search,
+            limit=settings.DEFAULT_PAGE_SIZE + 1,
+            after=cursor,
+        )
 
-    # Pagination
-    render_pagination(total_themes, settings.DEFAULT_PAGE_SIZE)
+
+@st.cache_data(ttl=60, max_entries=500)
+def load_theme_detail(theme_id):
+    """Load a theme with its newest articles, similar themes and timeline, cached per theme."""
+    with get_db() as db:
+        theme_repo = ThemeRepository(db)
+        timeline_repo = TimelineRepository(db)
+        theme_data = theme_repo.get_theme_with_articles(UUID(theme_id))
+
+        if not theme_data:
+            return None
+
+        theme = theme_data["theme"]
+        similar_themes = theme_repo.find_similar_themes(theme.name, exclude_id=theme.id)
+        timeline = timeline_repo.get_timeline_by_theme_id(theme.id)
+
+        return {
+            "id": theme.id,
+            "name": theme.name,
+            "created_at": theme.created_at,
+            "articles": theme_data["articles"],
+            "article_count": theme_data["article_count"],
+            "similar": [{"id": s.id, "name": s.name} for s in similar_themes],
+            "timeline_content": timeline.timeline_content if timeline else None,
+        }
+
+
+try:
+    # Keyset pagination: fetch one extra row to know whether a next page exists
+    search = search if search else None
+    cursor = get_page_cursor("theme_cursors", (start_date, end_date, search))
+    themes, remaining = load_theme_page(start_date, end_date, search, cursor)
+    next_cursor = None
+    if len(themes) > settings.DEFAULT_PAGE_SIZE:
+        themes = themes[:settings.DEFAULT_PAGE_SIZE]
+        next_cursor = ThemeRepository.theme_page_cursor(themes[-1])
+
+    # Pagination - earlier pages were all full, the count covers the rest
+    pages_before = len(st.session_state.get("theme_cursors", []))
+    total_themes = pages_before * settings.DEFAULT_PAGE_SIZE + remaining
+    render_cursor_pagination("theme_cursors", next_cursor, total_themes, settings.DEFAULT_PAGE_SIZE)
 
     if not themes:
         if start_date or end_date:
@@ -155,58 +160,39 @@ try:
 
         with col_list:
             st.markdown(f"### Themes ({total_themes})")
-            for theme in themes:
-                with st.container():
-                    if st.button(
-                        f"**{theme['name']}** ({theme['article_count']} articles)",
-                        key=f"theme_{theme['id']}",
-                        use_container_width=True,
-                    ):
-                        st.session_state.selected_theme_id = str(theme["id"])
-                        st.rerun()
+
+            def select_theme_row(page_themes=themes):
+                # Runs before the rerun; page_themes is the page the table showed
+                rows = st.session_state.theme_table.selection.rows
+                if rows:
+                    st.session_state.selected_theme_id = str(page_themes[rows[0]]["id"])
+
+            # One table widget for the page instead of a button per theme
+            st.dataframe(
+                [{"Theme": t["name"], "Articles": t["article_count"]} for t in themes],
+                key="theme_table",
+                on_select=select_theme_row,
+                selection_mode="single-row",
+                hide_index=True,
+                use_container_width=True,
+            )
 
         with col_detail:
             selected_id = st.session_state.get("selected_theme_id")
 
             if selected_id:
-                with get_db() as db:
-                    theme_repo = ThemeRepository(db)
-                    theme_data = theme_repo.get_theme_with_articles(UUID(selected_id))
-
-                    if theme_data:
-                        theme = theme_data["theme"]
-                        articles = theme_data["articles"]
-
-                        # Extract values while session is open
-                        theme_name = theme.name
-                        theme_id = theme.id
-                        theme_created_at = theme.created_at
-
-                        # Extract article data
-                        article_list = [
-                            {
-                                "id": a.id,
-                                "heading": a.title,
-                                "date": a.date
-                            }
-                            for a in articles
-                        ]
-
-                        # Find similar themes
-                        similar_themes = theme_repo.find_similar_themes(theme_name, exclude_id=theme_id)
-                        similar_list = [
-                            {"id": s.id, "name": s.name}
-                            for s in similar_themes
-                        ]
-
-                        # Get timeline for this theme
-                        timeline_repo = TimelineRepository(db)
-                        timeline = timeline_repo.get_timeline_by_theme_id(theme_id)
-                        theme_timeline_content = timeline.timeline_content if timeline else None
+                theme_data = load_theme_detail(selected_id)
 
                 if theme_data:
+                    theme_name = theme_data["name"]
+                    theme_created_at = theme_data["created_at"]
+                    article_list = theme_data["articles"]
+                    article_count = theme_data["article_count"]
+                    similar_list = theme_data["similar"]
+                    theme_timeline_content = theme_data["timeline_content"]
+
                     st.subheader(f"Theme: {theme_name}")
-                    st.caption(f"{len(article_list)} articles | Created: {theme_created_at.strftime('%Y-%m-%d') if theme_created_at else 'N/A'}")
+                    st.caption(f"{article_count} articles | Created: {theme_created_at.strftime('%Y-%m-%d') if theme_created_at else 'N/A'}")
 
                     # Edit name
                     new_name = st.text_input("Edit Theme Name", value=theme_name, key=f"edit_theme_name_{selected_id}")
@@ -214,6 +200,10 @@ try:
                         if st.button("Save Name", key="save_theme_name"):
                             result = content_service.update_theme_name(UUID(selected_id), new_name)
                             if result["success"]:
+                                load_theme_page.clear()
+                                # Other themes' similar-theme lists show the old name too
+                                load_theme_detail.clear()
+                                load_all_themes.clear()
                                 set_success("Theme name updated!")
                                 st.rerun()
 
@@ -228,18 +218,25 @@ try:
                     # Articles list
                     st.markdown("---")
                     st.markdown("### Articles")
-                    for article in article_list:
-                        article_heading = article['heading'] or "Untitled"
-                        article_date = article['date'].strftime('%Y-%m-%d') if article['date'] else 'N/A'
-                        article_id = article['id']
-
-                        col_article, col_link = st.columns([5, 1])
-                        with col_article:
-                            st.markdown(f"**{article_heading}** ({article_date})")
-                        with col_link:
-                            if st.button("View →", key=f"view_article_{article_id}"):
-                                st.session_state.selected_article_id = article_id
-                                st.switch_page("pages/3_articles.py")
+                    st.caption("Select an article to open it")
+                    # One table instead of a "View" button per article
+                    article_event = st.dataframe(
+                        [
+                            {"Article": article["heading"] or "Untitled", "Date": article["date"]}
+                            for article in article_list
+                        ],
+                        key=f"theme_articles_{selected_id}",
+                        on_select="rerun",
+                        selection_mode="single-row",
+                        column_config={"Date": st.column_config.DateColumn(format="YYYY-MM-DD")},
+                        hide_index=True,
+                        use_container_width=True,
+                    )
+                    if article_event.selection.rows:
+                        st.session_state.selected_article_id = article_list[article_event.selection.rows[0]]["id"]
+                        st.switch_page("pages/3_articles.py")
+                    if article_count > len(article_list):
+                        st.caption(f"... and {article_count - len(article_list)} more")
 
                     # Merge option
                     st.markdown("---")
@@ -254,6 +251,9 @@ try:
                                 if st.button("Merge →", key=f"merge_{sim['id']}"):
                                     result = content_service.merge_themes(UUID(selected_id), sim["id"])
                                     if result["success"]:
+                                        load_theme_page.clear()
+                                        load_theme_detail.clear()
+                                        load_all_themes.clear()
                                         set_success(f"Merged {result['articles_moved']} articles!")
                                         st.session_state.selected_theme_id = None
                                         st.rerun()
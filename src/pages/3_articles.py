@@ -1,20 +1,14 @@
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 import streamlit as st
 from uuid import UUID
 from src.config import settings
 from src.utils.session_state import init_session_state, show_messages, set_success
 from src.database.connection import get_db
 from src.database.repositories.article_repo import ArticleRepository
-from src.database.repositories.theme_repo import ThemeRepository
-from src.database.repositories.glossary_repo import GlossaryRepository
 from src.database.repositories.question_repo import QuestionRepository
 from src.database.repositories.timeline_repo import TimelineRepository
-from src.services.verification_service import ContentService
-from src.components.sidebar import render_sidebar_filters, render_pagination
+from src.services.verification_service import get_content_service
+from src.services.loaders import load_all_themes, load_article
+from src.components.sidebar import render_sidebar_filters, get_page_cursor, render_cursor_pagination
 
 st.set_page_config(
     page_title=f"Articles - {settings.APP_NAME}",
@@ -33,253 +27,308 @@ st.markdown("---")
 filters = render_sidebar_filters()
 
 # Service
-content_service = ContentService()
+content_service = get_content_service()
 
-try:
+
+@st.cache_data(ttl=300, max_entries=500)
+def load_article_related(learning_item_id, theme_id):
+    """Load an article's MCQs and theme timeline, cached per article."""
+    with get_db() as db:
+        question_repo = QuestionRepository(db)
+        timeline_repo = TimelineRepository(db)
+
+        timeline = None
+        if theme_id:
+            timeline = timeline_repo.get_timeline_by_theme_id(theme_id)
+
+        return {
+            "questions": question_repo.get_questions_for_article(learning_item_id),
+            "timeline_content": timeline.timeline_content if timeline else None,
+        }
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_article_page(start_date, end_date, search, cursor):
+    """One page of articles (plus one look-ahead row) and a count.
+
+    Filtered, the count is the exact number of articles from the cursor on;
+    unfiltered, it is the estimated number of all articles.
+    """
     with get_db() as db:
         article_repo = ArticleRepository(db)
-        theme_repo = ThemeRepository(db)
-
-        articles = article_repo.get_articles(
-            start_date=filters["start_date"],
-            end_date=filters["end_date"],
-            search=filters["search"],
-            limit=settings.DEFAULT_PAGE_SIZE,
-            offset=(st.session_state.current_page - 1) * settings.DEFAULT_PAGE_SIZE,
+
+        if not (start_date or end_date or search):
+            # "Show All" with no search: an exact count would scan the whole table
+            articles = article_repo.get_articles(
+                limit=settings.DEFAULT_PAGE_SIZE + 1,
+                after=cursor,
+            )
+            return articles, article_repo.get_article_count()
+        return article_repo.get_articles_with_count(
+            start_date=start_date,
+            end_date=end_date,
+            search=search,
+            limit=settings.DEFAULT_PAGE_SIZE + 1,
+            after=cursor,
         )
 
-        total_articles = article_repo.get_article_count(search=filters["search"])
-        all_themes = theme_repo.get_all_themes(limit=500)
 
-    # Pagination
-    render_pagination(total_articles, settings.DEFAULT_PAGE_SIZE)
+@st.fragment
+def render_article_list(filters):
+    """Paginated article list; paging reruns only this fragment."""
+    # Keyset pagination: fetch one extra row to know whether a next page exists
+    cursor = get_page_cursor(
+        "article_cursors",
+        (filters["start_date"], filters["end_date"], filters["search"]),
+    )
+    articles, count = load_article_page(
+        filters["start_date"], filters["end_date"], filters["search"], cursor
+    )
+    unfiltered = not (filters["start_date"] or filters["end_date"] or filters["search"])
+    if unfiltered:
+        total_articles = count
+    else:
+        # Earlier pages were all full, the count covers the rest
+        pages_before = len(st.session_state.get("article_cursors", []))
+        total_articles = pages_before * settings.DEFAULT_PAGE_SIZE + count
+
+    next_cursor = None
+    if len(articles) > settings.DEFAULT_PAGE_SIZE:
+        articles = articles[:settings.DEFAULT_PAGE_SIZE]
+        next_cursor = (articles[-1]["date"], articles[-1]["id"])
+
+    render_cursor_pagination(
+        "article_cursors",
+        next_cursor,
+        total_articles,
+        settings.DEFAULT_PAGE_SIZE,
+        approximate=unfiltered,
+    )
 
     if not articles:
         st.info("No articles found.")
-    else:
-        # Two columns layout
-        col_list, col_detail = st.columns([1, 2])
-
-        with col_list:
-            st.markdown("### Articles")
-            for article in articles:
-                # Better article display - full heading with theme below
-                heading = article['heading'] or "Untitled"
-                theme_name = article.get('theme_name') or 'No theme'
-                date_str = article['date'].strftime('%d %b') if article.get('date') else ''
-
-                label = f"📄 **{heading}**\n🏷️ {theme_name} • {date_str}"
-                if st.button(label, key=f"article_{article['id']}", use_container_width=True):
-                    st.session_state.selected_article_id = article["id"]
-                    st.rerun()
-
-        with col_detail:
-            selected_id = st.session_state.get("selected_article_id")
-
-            if selected_id:
-                with get_db() as db:
-                    article_repo = ArticleRepository(db)
-                    glossary_repo = GlossaryRepository(db)
-                    question_repo = QuestionRepository(db)
-                    timeline_repo = TimelineRepository(db)
-                    article = article_repo.get_article_by_id(selected_id)
-
-                    if article:
-                        # Store values we need outside the session
-                        article_heading = article.title
-                        article_date = article.date
-                        article_theme_id = article.news_theme_id
-                        article_pointed_analysis = article.text or ""
-                        article_mains_analysis = article.mains_info or ""
-                        article_prelims_info = article.prelims_info or ""
-                        article_id_uuid = article.id
-
-                        # Get keywords while session is open
-                        keywords = glossary_repo.get_keywords_for_article(article_id_uuid)
-
-                        # Get MCQs linked via item_relations
-                        questions = question_repo.get_questions_for_article(article.learning_item_id)
-
-                        # Get timeline for the article's theme
-                        theme_timeline_content = None
-                        article_theme_name = None
-                        if article_theme_id:
-                            timeline = timeline_repo.get_timeline_by_theme_id(article_theme_id)
-                            if timeline:
-                                theme_timeline_content = timeline.timeline_content
-                            # Get theme name for display
-                            for t in all_themes:
-                                if t["id"] == article_theme_id:
-                                    article_theme_name = t["name"]
-                                    break
-
-                if article:
-                    st.subheader(article_heading)
-                    st.caption(f"Date: {article_date.strftime('%Y-%m-%d') if article_date else 'N/A'}")
-
-                    st.markdown("---")
-
-                    # Theme assignment
-                    theme_names = ["None"] + [t["name"] for t in all_themes]
-                    theme_ids = [None] + [t["id"] for t in all_themes]
-
-                    current_idx = 0
-                    if article_theme_id:
-                        for i, tid in enumerate(theme_ids):
-                            if tid == article_theme_id:
-                                current_idx = i
-                                break
-
-                    selected_theme_idx = st.selectbox(
-                        "Theme",
-                        options=range(len(theme_names)),
-                        format_func=lambda i: theme_names[i],
-                        index=current_idx,
-                        key="article_theme",
-                    )
-                    new_theme_id = theme_ids[selected_theme_idx]
-
-                    # Editable content - tabs with markdown preview and collapsible edit
-                    tabs = st.tabs(["Pointed Analysis", "Mains Analysis", "Prelims Info", "Timeline Summary"])
-
-                    # Track edit state for each field
-                    edit_pointed_key = f"edit_pointed_{selected_id}"
-                    edit_mains_key = f"edit_mains_{selected_id}"
-                    edit_prelims_key = f"edit_prelims_{selected_id}"
-
-                    with tabs[0]:
-                        st.markdown(article_pointed_analysis)
-                        if st.button("✏️ Edit", key="btn_edit_pointed"):
-                            st.session_state[edit_pointed_key] = not st.session_state.get(edit_pointed_key, False)
-                            st.rerun()
-                        if st.session_state.get(edit_pointed_key, False):
-                            pointed_analysis = st.text_area("Edit Pointed Analysis", value=article_pointed_analysis, height=200, key="pointed", label_visibility="collapsed")
-                            if st.button("💾 Save Pointed", key="save_pointed"):
-                                updates = {"pointed_analysis": pointed_analysis, "theme_id": new_theme_id}
-                                result = content_service.update_article(selected_id, updates)
-                                if result["success"]:
-                                    st.session_state[edit_pointed_key] = False
-                                    set_success("Pointed Analysis saved!")
-                                    st.rerun()
-
-                    with tabs[1]:
-                        st.markdown(article_mains_analysis)
-                        if st.button("✏️ Edit", key="btn_edit_mains"):
-                            st.session_state[edit_mains_key] = not st.session_state.get(edit_mains_key, False)
-                            st.rerun()
-                        if st.session_state.get(edit_mains_key, False):
-                            mains_analysis = st.text_area("Edit Mains Analysis", value=article_mains_analysis, height=200, key="mains", label_visibility="collapsed")
-                            if st.button("💾 Save Mains", key="save_mains"):
-                                updates = {"mains_analysis": mains_analysis, "theme_id": new_theme_id}
-                                result = content_service.update_article(selected_id, updates)
-                                if result["success"]:
-                                    st.session_state[edit_mains_key] = False
-                                    set_success("Mains Analysis saved!")
-                                    st.rerun()
-
-                    with tabs[2]:
-                        st.markdown(article_prelims_info)
-                        if st.button("✏️ Edit", key="btn_edit_prelims"):
-                            st.session_state[edit_prelims_key] = not st.session_state.get(edit_prelims_key, False)
-                            st.rerun()
-                        if st.session_state.get(edit_prelims_key, False):
-                            prelims_info = st.text_area("Edit Prelims Info", value=article_prelims_info, height=200, key="prelims", label_visibility="collapsed")
-                            if st.button("💾 Save Prelims", key="save_prelims"):
-                                updates = {"prelims_info": prelims_info, "theme_id": new_theme_id}
-                                result = content_service.update_article(selected_id, updates)
-                                if result["success"]:
-                                    st.session_state[edit_prelims_key] = False
-                                    set_success("Prelims Info saved!")
-                                    st.rerun()
-
-                    with tabs[3]:
-                        # Timeline Summary - fetched from theme_timelines table
+        return
+
+    st.markdown("### Articles")
+    for article in articles:
+        # Better article display - full heading with theme below
+        heading = article['heading'] or "Untitled"
+        theme_name = article.get('theme_name') or 'No theme'
+        date_str = article['date'].strftime('%d %b') if article.get('date') else ''
+
+        label = f"📄 **{heading}**\n🏷️ {theme_name} • {date_str}"
+        if st.button(label, key=f"article_{article['id']}", use_container_width=True):
+            # Selecting an article changes the detail pane, so rerun the whole page
+            st.session_state.selected_article_id = article["id"]
+            st.rerun()
+
+
+try:
+    all_themes = load_all_themes()
+
+    # Two columns layout
+    col_list, col_detail = st.columns([1, 2])
+
+    with col_list:
+        render_article_list(filters)
+
+    with col_detail:
+        selected_id = st.session_state.get("selected_article_id")
+
+        if selected_id:
+            article = load_article(selected_id)
+
+            if article:
+                related = load_article_related(article["learning_item_id"], article["theme_id"])
+                article_heading = article["heading"]
+                article_date = article["date"]
+                article_theme_id = article["theme_id"]
+                article_pointed_analysis = article["pointed_analysis"]
+                article_mains_analysis = article["mains_analysis"]
+                article_prelims_info = article["prelims_info"]
+                article_id_uuid = article["id"]
+                keywords = article["keywords"]
+                questions = related["questions"]
+                theme_timeline_content = related["timeline_content"]
+
+                # Get theme name for display
+                article_theme_name = None
+                if article_theme_id:
+                    for t in all_themes:
+                        if t["id"] == article_theme_id:
+                            article_theme_name = t["name"]
+                            break
+
+                st.subheader(article_heading)
+                st.caption(f"Date: {article_date.strftime('%Y-%m-%d') if article_date else 'N/A'}")
+
+                st.markdown("---")
+
+                # Theme assignment
+                theme_names = ["None"] + [t["name"] for t in all_themes]
+                theme_ids = [None] + [t["id"] for t in all_themes]
+
+                current_idx = 0
+                if article_theme_id:
+                    for i, tid in enumerate(theme_ids):
+                        if tid == article_theme_id:
+                            current_idx = i
+                            break
+
+                selected_theme_idx = st.selectbox(
+                    "Theme",
+                    options=range(len(theme_names)),
+                    format_func=lambda i: theme_names[i],
+                    index=current_idx,
+                    key="article_theme",
+                )
+                new_theme_id = theme_ids[selected_theme_idx]
+
+                # Editable content - tabs with markdown preview and collapsible edit
+                tabs = st.tabs(["Pointed Analysis", "Mains Analysis", "Prelims Info", "Timeline Summary"])
+
+                # Track edit state for each field
+                edit_pointed_key = f"edit_pointed_{selected_id}"
+                edit_mains_key = f"edit_mains_{selected_id}"
+                edit_prelims_key = f"edit_prelims_{selected_id}"
+
+                with tabs[0]:
+                    st.markdown(article_pointed_analysis)
+                    if st.button("✏️ Edit", key="btn_edit_pointed"):
+                        st.session_state[edit_pointed_key] = not st.session_state.get(edit_pointed_key, False)
+                    if st.session_state.get(edit_pointed_key, False):
+                        pointed_analysis = st.text_area("Edit Pointed Analysis", value=article_pointed_analysis, height=200, key="pointed", label_visibility="collapsed")
+                        if st.button("💾 Save Pointed", key="save_pointed"):
+                            updates = {"pointed_analysis": pointed_analysis, "theme_id": new_theme_id}
+                            result = content_service.update_article(selected_id, updates)
+                            if result["success"]:
+                                st.session_state[edit_pointed_key] = False
+                                load_article.clear(selected_id)
+                                load_article_page.clear()
+                                set_success("Pointed Analysis saved!")
+                                st.rerun()
+
+                with tabs[1]:
+                    st.markdown(article_mains_analysis)
+                    if st.button("✏️ Edit", key="btn_edit_mains"):
+                        st.session_state[edit_mains_key] = not st.session_state.get(edit_mains_key, False)
+                    if st.session_state.get(edit_mains_key, False):
+                        mains_analysis = st.text_area("Edit Mains Analysis", value=article_mains_analysis, height=200, key="mains", label_visibility="collapsed")
+                        if st.button("💾 Save Mains", key="save_mains"):
+                            updates = {"mains_analysis": mains_analysis, "theme_id": new_theme_id}
+                            result = content_service.update_article(selected_id, updates)
+                            if result["success"]:
+                                st.session_state[edit_mains_key] = False
+                                load_article.clear(selected_id)
+                                load_article_page.clear()
+                                set_success("Mains Analysis saved!")
+                                st.rerun()
+
+                with tabs[2]:
+                    st.markdown(article_prelims_info)
+                    if st.button("✏️ Edit", key="btn_edit_prelims"):
+                        st.session_state[edit_prelims_key] = not st.session_state.get(edit_prelims_key, False)
+                    if st.session_state.get(edit_prelims_key, False):
+                        prelims_info = st.text_area("Edit Prelims Info", value=article_prelims_info, height=200, key="prelims", label_visibility="collapsed")
+                        if st.button("💾 Save Prelims", key="save_prelims"):
+                            updates = {"prelims_info": prelims_info, "theme_id": new_theme_id}
+                            result = content_service.update_article(selected_id, updates)
+                            if result["success"]:
+                                st.session_state[edit_prelims_key] = False
+                                load_article.clear(selected_id)
+                                load_article_page.clear()
+                                set_success("Prelims Info saved!")
+                                st.rerun()
+
+                with tabs[3]:
+                    # Timeline Summary - fetched from theme_timelines table
+                    if article_theme_name:
+                        st.caption(f"Timeline for theme: **{article_theme_name}**")
+                    if theme_timeline_content:
+                        st.markdown(theme_timeline_content)
+                    else:
                         if article_theme_name:
-                            st.caption(f"Timeline for theme: **{article_theme_name}**")
-                        if theme_timeline_content:
-                            st.markdown(theme_timeline_content)
+                            st.info(f"No timeline available for theme '{article_theme_name}'")
                         else:
-                            if article_theme_name:
-                                st.info(f"No timeline available for theme '{article_theme_name}'")
-                            else:
-                                st.info("No theme assigned to this article")
-
-                    # Keywords section
-                    st.markdown("---")
-                    st.markdown("### Keywords")
-
-                    if keywords:
-                        for kw in keywords:
-                            col1, col2 = st.columns([4, 1])
-                            with col1:
-                                st.write(f"**{kw['keyword']}**: {kw['definition'][:80] if kw.get('definition') else 'No definition'}...")
-                            with col2:
-                                if st.button("Remove", key=f"rm_kw_{kw['id']}"):
-                                    content_service.remove_keyword_from_article(article_id_uuid, kw["id"])
-                                    st.rerun()
-                    else:
-                        st.info("No keywords linked to this article")
-
-                    # Questions section
-                    st.markdown("---")
-                    st.markdown(f"### Questions ({len(questions)})")
-
-                    def get_english_text(content):
-                        if content is None:
-                            return ""
-                        if isinstance(content, dict):
-                            if "english" in content:
-                                return str(content["english"])
-                            if "text" in content:
-                                return str(content["text"])
-                            return str(content)
+                            st.info("No theme assigned to this article")
+
+                # Keywords section
+                st.markdown("---")
+                st.markdown("### Keywords")
+
+                if keywords:
+                    for kw in keywords:
+                        col1, col2 = st.columns([4, 1])
+                        with col1:
+                            st.write(f"**{kw['keyword']}**: {kw['definition'][:80] if kw.get('definition') else 'No definition'}...")
+                        with col2:
+                            if st.button("Remove", key=f"rm_kw_{kw['id']}"):
+                                content_service.remove_keyword_from_article(article_id_uuid, kw["id"])
+                                load_article.clear(selected_id)
+                                st.rerun()
+                else:
+                    st.info("No keywords linked to this article")
+
+                # Questions section
+                st.markdown("---")
+                st.markdown(f"### Questions ({len(questions)})")
+
+                def get_english_text(content):
+                    if content is None:
+                        return ""
+                    if isinstance(content, dict):
+                        if "english" in content:
+                            return str(content["english"])
+                        if "text" in content:
+                            return str(content["text"])
                         return str(content)
-
-                    if questions:
-                        with st.expander(f"**MCQs** ({len(questions)} questions)", expanded=False):
-                            for i, q in enumerate(questions):
-                                q_id = q.get("question_id")
-
-                                st.markdown(f"**Q{i+1}.** {q.get('question_text', '')}")
-
-                                # Metadata
-                                meta_cols = st.columns(3)
-                                with meta_cols[0]:
-                                    if q.get("question_pattern"):
-                                        st.caption(f"Pattern: {q['question_pattern']}")
-                                with meta_cols[1]:
-                                    if q.get("is_multi_select"):
-                                        st.caption("Multi-select: Yes")
-                                with meta_cols[2]:
-                                    if q.get("silly_mistake_prone"):
-                                        st.caption("Silly mistake prone")
-
-                                # Options
-                                options = q.get("options")
-                                if options and isinstance(options, list):
-                                    st.markdown("**Options:**")
-                                    for opt in options:
-                                        if isinstance(opt, dict):
-                                            opt_id = opt.get('id', '')
-                                            opt_text = opt.get('text', opt.get('value', str(opt)))
-                                            is_correct = str(opt_id) in [str(c) for c in (q.get("correct_option_ids") or [])]
-                                            marker = " ✓" if is_correct else ""
-                                            st.markdown(f"- {opt_text}{marker}")
-                                        else:
-                                            st.markdown(f"- {opt}")
-
-                                # Explanation
-                                explanation = q.get("explanation")
-                                if explanation:
-                                    with st.expander("Explanation", expanded=False):
-                                        st.markdown(get_english_text(explanation))
-
-                                if i < len(questions) - 1:
-                                    st.markdown("---")
-                    else:
-                        st.info("No MCQs linked to this article")
-            else:
-                st.info("👈 Select an article from the list to edit")
+                    return str(content)
+
+                if questions:
+                    with st.expander(f"**MCQs** ({len(questions)} questions)", expanded=False):
+                        for i, q in enumerate(questions):
+                            q_id = q.get("question_id")
+
+                            st.markdown(f"**Q{i+1}.** {q.get('question_text', '')}")
+
+                            # Metadata
+                            meta_cols = st.columns(3)
+                            with meta_cols[0]:
+                                if q.get("question_pattern"):
+                                    st.caption(f"Pattern: {q['question_pattern']}")
+                            with meta_cols[1]:
+                                if q.get("is_multi_select"):
+                                    st.caption("Multi-select: Yes")
+                            with meta_cols[2]:
+                                if q.get("silly_mistake_prone"):
+                                    st.caption("Silly mistake prone")
+
+                            # Options
+                            options = q.get("options")
+                            if options and isinstance(options, list):
+                                st.markdown("**Options:**")
+                                for opt in options:
+                                    if isinstance(opt, dict):
+                                        opt_id = opt.get('id', '')
+                                        opt_text = opt.get('text', opt.get('value', str(opt)))
+                                        is_correct = str(opt_id) in [str(c) for c in (q.get("correct_option_ids") or [])]
+                                        marker = " ✓" if is_correct else ""
+                                        st.markdown(f"- {opt_text}{marker}")
+                                    else:
+                                        st.markdown(f"- {opt}")
+
+                            # Explanation
+                            explanation = q.get("explanation")
+                            if explanation:
+                                with st.expander("Explanation", expanded=False):
+                                    st.markdown(get_english_text(explanation))
+
+                            if i < len(questions) - 1:
+                                st.markdown("---")
+                else:
+                    st.info("No MCQs linked to this article")
+        else:
+            st.info("👈 Select an article from the list to edit")
 
 except Exception as e:
     st.error(f"Error: {str(e)}")
@@ -1,16 +1,11 @@
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 import streamlit as st
 from uuid import UUID
 from src.config import settings
 from src.utils.session_state import init_session_state, show_messages, set_success
 from src.database.connection import get_db
 from src.database.repositories.glossary_repo import GlossaryRepository
-from src.services.verification_service import ContentService
-from src.components.sidebar import render_sidebar_filters, render_pagination
+from src.services.verification_service import get_content_service
+from src.components.sidebar import render_sidebar_filters, get_page_cursor, render_cursor_pagination
 
 st.set_page_config(
     page_title=f"Definitions - {settings.APP_NAME}",
@@ -29,22 +24,53 @@ st.markdown("---")
 filters = render_sidebar_filters()
 
 # Service
-content_service = ContentService()
+content_service = get_content_service()
 
-try:
+
+@st.cache_data(ttl=30, show_spinner=False)
+def load_definition_page(search, cursor):
+    """One page of keywords (plus one look-ahead row) and the remaining count."""
     with get_db() as db:
         glossary_repo = GlossaryRepository(db)
-
-        definitions = glossary_repo.get_all_keywords(
-            search=filters["search"],
-            limit=settings.DEFAULT_PAGE_SIZE,
-            offset=(st.session_state.current_page - 1) * settings.DEFAULT_PAGE_SIZE,
+        return glossary_repo.get_all_keywords_with_count(
+            search=search,
+            limit=settings.DEFAULT_PAGE_SIZE + 1,
+            after=cursor,
         )
 
-        total_definitions = glossary_repo.get_keyword_count(search=filters["search"])
 
-    # Pagination
-    render_pagination(total_definitions, settings.DEFAULT_PAGE_SIZE)
+@st.cache_data(ttl=300, max_entries=500)
+def load_keyword_detail(keyword_id):
+    """Load a keyword and the first articles using it, cached per keyword."""
+    with get_db() as db:
+        glossary_repo = GlossaryRepository(db)
+        keyword_data = glossary_repo.get_keyword_with_articles(UUID(keyword_id), limit=10)
+        if not keyword_data:
+            return None
+
+        keyword = keyword_data["keyword"]
+        return {
+            "keyword": keyword.keyword,
+            "definition": keyword.definition or "",
+            "created_at": keyword.created_at,
+            "articles": keyword_data["articles"],
+            "article_count": keyword_data["article_count"],
+        }
+
+
+try:
+    # Keyset pagination: fetch one extra row to know whether a next page exists
+    cursor = get_page_cursor("definition_cursors", filters["search"])
+    definitions, remaining = load_definition_page(filters["search"], cursor)
+    next_cursor = None
+    if len(definitions) > settings.DEFAULT_PAGE_SIZE:
+        definitions = definitions[:settings.DEFAULT_PAGE_SIZE]
+        next_cursor = (definitions[-1]["created_at"], definitions[-1]["id"])
+
+    # Pagination - earlier pages were all full, the count covers the rest
+    pages_before = len(st.session_state.get("definition_cursors", []))
+    total_definitions = pages_before * settings.DEFAULT_PAGE_SIZE + remaining
+    render_cursor_pagination("definition_cursors", next_cursor, total_definitions, settings.DEFAULT_PAGE_SIZE)
 
     if not definitions:
         st.info("No definitions found.")
@@ -65,32 +91,17 @@ try:
             selected_id = st.session_state.get("selected_keyword_id")
 
             if selected_id:
-                with get_db() as db:
-                    glossary_repo = GlossaryRepository(db)
-                    keyword_data = glossary_repo.get_keyword_with_articles(UUID(selected_id))
-
-                    if keyword_data:
-                        keyword = keyword_data["keyword"]
-                        articles = keyword_data["articles"]
-
-                        # Extract values while session is open
-                        keyword_name = keyword.keyword
-                        keyword_definition = keyword.definition or ""
-                        keyword_created_at = keyword.created_at
-
-                        # Extract article data
-                        article_list = [
-                            {
-                                "id": a.id,
-                                "heading": a.title,
-                                "date": a.date
-                            }
-                            for a in articles
-                        ]
+                keyword_data = load_keyword_detail(selected_id)
 
                 if keyword_data:
+                    keyword_name = keyword_data["keyword"]
+                    keyword_definition = keyword_data["definition"]
+                    keyword_created_at = keyword_data["created_at"]
+                    article_list = keyword_data["articles"]
+                    article_count = keyword_data["article_count"]
+
                     st.subheader(f"Keyword: {keyword_name}")
-                    st.caption(f"Used in {len(article_list)} articles | Created: {keyword_created_at.strftime('%Y-%m-%d') if keyword_created_at else 'N/A'}")
+                    st.caption(f"Used in {article_count} articles | Created: {keyword_created_at.strftime('%Y-%m-%d') if keyword_created_at else 'N/A'}")
 
                     # Edit keyword name - use dynamic key based on selected_id
                     new_keyword_name = st.text_input("Keyword", value=keyword_name, key=f"edit_keyword_name_{selected_id}")
@@ -123,6 +134,8 @@ try:
                             result = content_service.update_definition(UUID(selected_id), new_definition)
 
                         if result["success"]:
+                            load_keyword_detail.clear(selected_id)
+                            load_definition_page.clear()
                             set_success("Definition saved!")
                             st.rerun()
 
@@ -130,7 +143,7 @@ try:
                     st.markdown("---")
                     st.markdown("### Articles Using This Keyword")
                     if article_list:
-                        for article in article_list[:10]:
+                        for article in article_list:
                             col_article, col_link = st.columns([5, 1])
                             with col_article:
                                 date_str = article['date'].strftime('%Y-%m-%d') if article['date'] else 'N/A'
@@ -139,8 +152,8 @@ try:
                                 if st.button("View →", key=f"view_article_{article['id']}_{selected_id}"):
                                     st.session_state.selected_article_id = article['id']
                                     st.switch_page("pages/3_articles.py")
-                        if len(article_list) > 10:
-                            st.caption(f"... and {len(article_list) - 10} more")
+                        if article_count > len(article_list):
+                            st.caption(f"... and {article_count - len(article_list)} more")
                     else:
                         st.info("No articles use this keyword")
             else:
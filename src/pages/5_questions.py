@@ -1,17 +1,13 @@
-import sys
-from pathlib import Path
 from datetime import datetime, timedelta
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 import streamlit as st
 from uuid import UUID
 from src.config import settings
 from src.utils.session_state import init_session_state, show_messages, set_success
 from src.database.connection import get_db
 from src.database.repositories.question_repo import QuestionRepository
-from src.database.repositories.theme_repo import ThemeRepository
-from src.services.verification_service import ContentService
+from src.services.verification_service import get_content_service
+from src.services.loaders import load_all_themes
 
 st.set_page_config(
     page_title=f"Questions - {settings.APP_NAME}",
@@ -73,7 +69,7 @@ if "selected_questions" not in st.session_state:
         st.session_state.selected_questions = set()
 
 # Service
-content_service = ContentService()
+content_service = get_content_service()
 
 
 def get_english_text(content):
@@ -99,9 +95,7 @@ def toggle_question(q_id):
 
 try:
     # Theme filter - fetch all themes for the dropdown
-    with get_db() as db:
-        theme_repo = ThemeRepository(db)
-        all_themes = theme_repo.get_all_themes(limit=500)
+    all_themes = load_all_themes()
 
     all_theme_names = [t["name"] for t in all_themes]
     theme_id_map = {t["name"]: t["id"] for t in all_themes}
@@ -219,7 +213,6 @@ try:
                     with col_edit:
                         if st.button("Edit", key=f"btn_edit_dq_{q_id}"):
                             st.session_state[edit_q_key] = not st.session_state.get(edit_q_key, False)
-                            st.rerun()
 
                     # Question text
                     if question_text:
@@ -0,0 +1,59 @@
+import streamlit as st
+
+from src.database.connection import get_db
+from src.database.repositories.article_repo import ArticleRepository
+from src.database.repositories.stats_repo import StatsRepository
+from src.database.repositories.theme_repo import ThemeRepository
+
+
+# Cached loaders shared by several pages. st.cache_data keys a cache by the
+# function, so every page reads (and clears) the same entries.
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_all_themes():
+    """All themes (id + name) for the theme dropdowns.
+
+    Clear after renaming or merging a theme.
+    """
+    with get_db() as db:
+        theme_repo = ThemeRepository(db)
+        all_themes = theme_repo.get_all_themes(limit=500)
+    return [{"id": t["id"], "name": t["name"]} for t in all_themes]
+
+
+@st.cache_data(ttl=300, max_entries=500, show_spinner=False)
+def load_article(article_id):
+    """One article with its full analysis text and keywords, or None if it does not exist.
+
+    Clear it with load_article.clear(article_id) after every edit of the
+    article or its keywords.
+    """
+    with get_db() as db:
+        article_repo = ArticleRepository(db)
+        article_data = article_repo.get_article_with_keywords(article_id)
+        if not article_data:
+            return None
+        article = article_data["article"]
+        return {
+            "id": article.id,
+            "heading": article.title,
+            "date": article.date,
+            "theme_id": article.news_theme_id,
+            "learning_item_id": article.learning_item_id,
+            "pointed_analysis": article.text or "",
+            "mains_analysis": article.mains_info or "",
+            "prelims_info": article.prelims_info or "",
+            "keywords": [
+                {"id": kw.id, "keyword": kw.keyword, "definition": kw.definition}
+                for kw in article_data["keywords"]
+            ],
+        }
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_dashboard_counts():
+    """Theme, article and glossary counts, fetched in one query."""
+    with get_db() as db:
+        stats_repo = StatsRepository(db)
+        return stats_repo.get_dashboard_counts()
@@ -1,11 +1,14 @@
 from typing import Optional, Dict, Any
 from uuid import UUID
 
+import streamlit as st
+
 from src.database.connection import get_db
 from src.database.repositories.theme_repo import ThemeRepository
 from src.database.repositories.article_repo import ArticleRepository
 from src.database.repositories.glossary_repo import GlossaryRepository
 from src.database.repositories.question_repo import QuestionRepository
+from src.services.loaders import load_dashboard_counts
 
 
 class ContentService:
@@ -26,12 +29,10 @@ class ContentService:
         with get_db() as db:
             theme_repo = ThemeRepository(db)
 
-            source = theme_repo.get_theme_with_articles(source_theme_id)
-            if not source:
+            if not theme_repo.get_theme_by_id(source_theme_id):
                 return {"success": False, "error": "Source theme not found"}
 
-            article_count = len(source["articles"])
-            theme_repo.merge_themes(source_theme_id, target_theme_id)
+            article_count = theme_repo.merge_themes(source_theme_id, target_theme_id)
 
             return {
                 "success": True,
@@ -44,8 +45,7 @@ class ContentService:
         """Update article content."""
         with get_db() as db:
             article_repo = ArticleRepository(db)
-            article = article_repo.update_article(article_id, updates)
-            if article:
+            if article_repo.update_article(article_id, updates):
                 return {"success": True, "article_id": str(article_id)}
             return {"success": False, "error": "Article not found"}
 
@@ -114,14 +114,11 @@ class ContentService:
 
     # Dashboard Stats
     def get_stats(self) -> dict:
-        """Get content statistics for dashboard."""
-        with get_db() as db:
-            theme_repo = ThemeRepository(db)
-            article_repo = ArticleRepository(db)
-            glossary_repo = GlossaryRepository(db)
+        """Get content statistics for dashboard (cached for 5 minutes)."""
+        return load_dashboard_counts()
 
-            return {
-                "themes": theme_repo.get_theme_count(),
-                "articles": article_repo.get_article_count(),
-                "definitions": glossary_repo.get_keyword_count(),
-            }
+
+@st.cache_resource
+def get_content_service() -> ContentService:
+    """Shared ContentService instance, built once per process."""
+    return ContentService()
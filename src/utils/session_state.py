@@ -14,7 +14,6 @@ def init_session_state():
         "selected_article_id": None,
         "selected_keyword_id": None,
         # Pagination
-        "current_page": 1,
         "page_size": 20,
         # Messages
         "success_message": None,
@@ -52,7 +51,3 @@ def set_error(message: str):
     """Set an error message to display."""
     st.session_state.error_message = message
 
-
-def reset_pagination():
-    """Reset pagination to first page."""
-    st.session_state.current_page = 1